@@ -0,0 +1,415 @@
+"""
+Benchmark the AoC 2025 solutions.
+Runs the parser and every part of each registered day with warmup rounds
+and repeated measurements, then reports min/median/p95 runtimes.
+Parse time is reported apart from solve time. With --cached, the parsed
+input comes from the parse cache and the parser is not timed.
+With --sweep, every stage runs on generated inputs of growing size, and the
+report estimates the empirical complexity, the exponent k in t ~ n^k,
+and flags stages that scale worse than their day module declares.
+Peak memory of every stage is measured in one extra, untimed run.
+With --startup, the import time of every day module is measured instead,
+each in a fresh interpreter, and checked against a time budget.
+With --strategies, the alternative solvers that a day module registers for
+a part are checked against its default solver, on the example, on a
+generated input and on the edge cases of the day, and then benchmarked
+side by side with it.
+Every run is appended to the benchmark history, see history.py.
+"""
+import argparse
+import copy
+import json
+import math
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+import generators
+import history
+import instrument
+import runner
+from cache import ParseCache
+
+STARTUP_BUDGET = 25.0  # milliseconds per day module
+COMPLEXITY_TOLERANCE = 0.3  # measured exponents may exceed the declared ones by this much
+
+
+def measure(func: Callable[[Any], Any], arg: Any, repeat: int, warmup: int) -> tuple[Any, list[float]]:
+    """
+    Call func(arg) warmup times without timing, then repeat times with timing.
+    Each call gets its own deep copy of arg, because some solvers consume
+    their input. Copying happens outside the timed region.
+    """
+    result = None
+    for _ in range(warmup):
+        result = func(copy.deepcopy(arg))
+    samples = []
+    for _ in range(repeat):
+        data = copy.deepcopy(arg)
+        start = time.perf_counter()
+        result = func(data)
+        end = time.perf_counter()
+        samples.append(end - start)
+    return result, samples
+
+
+def summarize(samples: list[float]) -> dict[str, float | int]:
+    if len(samples) > 1:
+        p95 = statistics.quantiles(samples, n=20, method="inclusive")[-1]
+    else:
+        p95 = samples[0]
+    return {
+        "runs": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": p95,
+    }
+
+
+def bench_puzzle(puzzle: runner.Puzzle, text: str, repeat: int, warmup: int, cached: bool = False) -> list[dict]:
+    records = []
+
+    if puzzle.parse is None or cached:
+        puzzle_input, _ = puzzle.prepare(text, ParseCache())
+    else:
+        puzzle_input, samples = measure(puzzle.parse, text, repeat, warmup)
+        peak = instrument.peak_memory(puzzle.parse, text)
+        records.append(
+            {"day": puzzle.day, "stage": "parse", "answer": None, "peak_bytes": peak} | summarize(samples))
+
+    for part, solver in puzzle.parts.items():
+        answer, samples = measure(solver, puzzle_input, repeat, warmup)
+        peak = instrument.peak_memory(solver, copy.deepcopy(puzzle_input))
+        records.append(
+            {"day": puzzle.day, "stage": f"part{part}", "answer": answer, "peak_bytes": peak} | summarize(samples))
+
+    return records
+
+
+def scaling_of(puzzle: runner.Puzzle) -> generators.Scaling | None:
+    """The generator hook of the day module comes first, then the one in generators.py."""
+    if puzzle.generate is not None:
+        return generators.Scaling(puzzle.generate, puzzle.base_size)
+    return generators.GENERATORS.get(puzzle.day)
+
+
+def sweep(puzzle: runner.Puzzle, steps: int, repeat: int, warmup: int, seed: int) -> list[dict]:
+    """Benchmark the puzzle on generated inputs, doubling the size in each step."""
+    scaling = scaling_of(puzzle)
+    records = []
+    for step in range(steps):
+        size = scaling.base * 2 ** step
+        text = scaling.generate(size, generators.seeded(puzzle.day, size, seed))
+        records.extend(record | {"size": size} for record in bench_puzzle(puzzle, text, repeat, warmup))
+    return records
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    """Least squares fit of log(t) = k * log(n) + c. Return k."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in times]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def complexity(records: list[dict], declared: dict[int, dict[str, float]]) -> list[dict]:
+    """
+    Estimate the exponent of every day and stage from the median runtimes of a sweep,
+    and compare it with the exponent declared by the day module, if any.
+    """
+    estimates = []
+    key = itemgetter("day", "stage")
+    for (day, stage), group in groupby(sorted(records, key=key), key=key):
+        group = sorted(group, key=itemgetter("size"))
+        sizes = [record["size"] for record in group]
+        medians = [record["median"] for record in group]
+        exponent = fit_exponent(sizes, medians) if len(sizes) > 1 else None
+        expected = declared.get(day, {}).get(stage)
+        worse = None not in (exponent, expected) and exponent > expected + COMPLEXITY_TOLERANCE
+        estimates.append({
+            "day": day, "stage": stage, "sizes": sizes, "medians": medians,
+            "exponent": exponent, "expected": expected, "worse_than_expected": worse,
+        })
+    return estimates
+
+
+def format_estimate(estimate: dict) -> str:
+    head = f"day {estimate['day']:02d} {estimate['stage']:<6}"
+    if estimate["exponent"] is None:
+        return f"{head}  needs two or more sizes"
+    expected = "" if estimate["expected"] is None else f", expected O(n^{estimate['expected']:.2f})"
+    worse = "  <-- WORSE THAN EXPECTED" if estimate["worse_than_expected"] else ""
+    return (
+        f"{head}  ~ O(n^{estimate['exponent']:.2f}) for n in {estimate['sizes'][0]}...{estimate['sizes'][-1]}"
+        f"{expected}{worse}"
+    )
+
+
+def load_example(puzzle: runner.Puzzle) -> str | None:
+    """The example text from the .ini file of the day, if there is one."""
+    file = puzzle.input_file.with_suffix(".ini")
+    if not file.exists():
+        return None
+    text, *_ = sys.modules[f"day{puzzle.day:02d}"].load_example(file)
+    return text
+
+
+def strategy_input(puzzle: runner.Puzzle, part: int, name: str, text: str, puzzle_input: Any) -> Any:
+    """The text parsed by the strategy's own parser, if it has one, or else a copy of the parsed puzzle input."""
+    parse = puzzle.strategy_parser(part, name)
+    return parse(text) if parse is not None else copy.deepcopy(puzzle_input)
+
+
+def check_strategies(puzzle: runner.Puzzle, inputs: dict[str, str]) -> list[dict]:
+    """
+    Solve every named input with every strategy of each part that has alternatives.
+    Return one record per input and strategy that does not agree with the default solver.
+    """
+    mismatches = []
+    for source, text in inputs.items():
+        puzzle_input, _ = puzzle.prepare(text)
+        for part in puzzle.parts:
+            strategies = puzzle.strategies(part)
+            if len(strategies) < 2:
+                continue
+            answers = {
+                name: solver(strategy_input(puzzle, part, name, text, puzzle_input))
+                for name, solver in strategies.items()
+            }
+            expected = answers[runner.DEFAULT]
+            mismatches.extend(
+                {"day": puzzle.day, "part": part, "strategy": name, "input": source,
+                 "answer": answer, "expected": expected}
+                for name, answer in answers.items() if answer != expected
+            )
+    return mismatches
+
+
+def bench_strategies(puzzle: runner.Puzzle, text: str, repeat: int, warmup: int) -> list[dict]:
+    """
+    Benchmark every strategy of each part that has alternatives, on the same parsed input,
+    or on the text parsed by the strategy's own parser. Parsing is not timed.
+    """
+    puzzle_input, _ = puzzle.prepare(text)
+    records = []
+    for part in puzzle.parts:
+        strategies = puzzle.strategies(part)
+        if len(strategies) < 2:
+            continue
+        part_records = []
+        for name, solver in strategies.items():
+            answer, samples = measure(solver, strategy_input(puzzle, part, name, text, puzzle_input), repeat, warmup)
+            part_records.append(
+                {"day": puzzle.day, "stage": f"part{part}", "strategy": name, "answer": answer, "peak_bytes": None}
+                | summarize(samples))
+        fastest = min(record["median"] for record in part_records)
+        for record in part_records:
+            record["relative"] = record["median"] / fastest if fastest > 0 else 1.0
+        records.extend(part_records)
+    return records
+
+
+def format_strategy(record: dict) -> str:
+    return (
+        f"day {record['day']:02d} {record['stage']:<6} {record['strategy']:<16}"
+        f"  min {record['min'] * 1000:10.3f} ms"
+        f"  median {record['median'] * 1000:10.3f} ms"
+        f"  p95 {record['p95'] * 1000:10.3f} ms"
+        f"  x{record['relative']:6.2f}  answer = {record['answer']}"
+    )
+
+
+def format_mismatch(mismatch: dict) -> str:
+    return (
+        f"day {mismatch['day']:02d} part{mismatch['part']} {mismatch['strategy']:<16}"
+        f"  {mismatch['input']}: answer = {mismatch['answer']}, default = {mismatch['expected']}  <-- MISMATCH"
+    )
+
+
+def import_time(module: str) -> float:
+    """
+    Import the module in a fresh interpreter and return its cumulative import time
+    in seconds, as reported by -X importtime. The runner is imported beforehand,
+    so that its cost is not charged to the module.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import runner; import {module}"],
+        cwd=runner.SRC, capture_output=True, text=True, check=True,
+    )
+    for line in completed.stderr.splitlines():
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    raise LookupError(f"no import time reported for {module}")
+
+
+def bench_startup(day: int, repeat: int, warmup: int, budget: float) -> dict:
+    """Measure the import time of a day module, budget in milliseconds."""
+    module = f"day{day:02d}"
+    for _ in range(warmup):
+        import_time(module)
+    samples = [import_time(module) for _ in range(repeat)]
+    record = {"day": day, "stage": "import", "answer": None, "peak_bytes": None} | summarize(samples)
+    record["over_budget"] = record["median"] * 1000 > budget
+    return record
+
+
+def format_record(record: dict) -> str:
+    answer = "" if record["answer"] is None else f"  answer = {record['answer']}"
+    size = f"  n = {record['size']:<8}" if "size" in record else ""
+    peak = "" if record["peak_bytes"] is None else f"  peak {record['peak_bytes'] / 2 ** 20:8.3f} MiB"
+    over_budget = "  <-- OVER BUDGET" if record.get("over_budget") else ""
+    return (
+        f"day {record['day']:02d} {record['stage']:<6}{size}"
+        f"  min {record['min'] * 1000:10.3f} ms"
+        f"  median {record['median'] * 1000:10.3f} ms"
+        f"  p95 {record['p95'] * 1000:10.3f} ms"
+        f"{peak}{answer}{over_budget}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the AoC solutions (parse and solve, per part).")
+    parser.add_argument("days", metavar="DAY", type=int, nargs="*", help="days to run (default: all)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="timed runs per stage (default=5)")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed runs per stage (default=1)")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="option flag: if set, print a JSON report instead of a table (default=not set)")
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="option flag: if set, take parsed input from the parse cache, do not time parsing (default=not set)")
+    parser.add_argument(
+        "--sweep",
+        action="store_true",
+        default=False,
+        help="option flag: if set, run on generated inputs of growing size (default=not set)")
+    parser.add_argument("--steps", type=int, default=4, help="sizes per sweep, doubling each step (default=4)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated inputs (default=0)")
+    parser.add_argument(
+        "--startup",
+        action="store_true",
+        default=False,
+        help="option flag: if set, measure the import time of the day modules (default=not set)")
+    parser.add_argument(
+        "--budget", type=float, default=STARTUP_BUDGET,
+        help=f"import time budget per day module in ms (default={STARTUP_BUDGET})")
+    parser.add_argument(
+        "--strategies",
+        action="store_true",
+        default=False,
+        help="option flag: if set, check and compare the alternative solvers of each part (default=not set)")
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        default=False,
+        help="option flag: if set, mark this run as the baseline for history.py compare (default=not set)")
+    parser.add_argument(
+        "--history", type=Path, default=history.HISTORY_FILE,
+        help=f"benchmark history file (default={history.HISTORY_FILE.relative_to(runner.SRC)})")
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        default=False,
+        help="option flag: if set, do not append this run to the history (default=not set)")
+    args = parser.parse_args()
+
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("need at least one timed run and no negative warmup")
+    if args.sweep and args.steps < 1:
+        parser.error("need at least one sweep step")
+    if args.sweep + args.startup + args.strategies > 1:
+        parser.error("--sweep, --startup and --strategies do not go together")
+
+    records = []
+    skipped = []
+    declared = {}
+    mismatches = []
+    for day in args.days or runner.discover():
+        if args.startup:
+            record = bench_startup(day, args.repeat, args.warmup, args.budget)
+            records.append(record)
+            if not args.json:
+                print(format_record(record))
+            continue
+        puzzle = runner.load(day)
+        if args.strategies:
+            if not any(len(puzzle.strategies(part)) > 1 for part in puzzle.parts):
+                skipped.append(day)
+                continue
+            generated = None
+            if (scaling := scaling_of(puzzle)) is not None:
+                generated = scaling.generate(scaling.base, generators.seeded(day, scaling.base, args.seed))
+            inputs = {"example": load_example(puzzle), f"generated n = {scaling and scaling.base}": generated}
+            inputs |= {f"edge case {name}": text for name, text in puzzle.edge_cases.items()}
+            day_mismatches = check_strategies(puzzle, {source: text for source, text in inputs.items() if text})
+            mismatches.extend(day_mismatches)
+            text = puzzle.read_input() if puzzle.input_file.exists() else generated
+            if text is None:
+                skipped.append(day)
+                continue
+            day_records = bench_strategies(puzzle, text, args.repeat, args.warmup)
+            records.extend(day_records)
+            if not args.json:
+                for mismatch in day_mismatches:
+                    print(format_mismatch(mismatch))
+                for record in day_records:
+                    print(format_strategy(record))
+            continue
+        if args.sweep:
+            if scaling_of(puzzle) is None:
+                skipped.append(day)
+                continue
+            day_records = sweep(puzzle, args.steps, args.repeat, args.warmup, args.seed)
+            declared[day] = puzzle.complexity
+        elif puzzle.input_file.exists():
+            day_records = bench_puzzle(puzzle, puzzle.read_input(), args.repeat, args.warmup, args.cached)
+        else:
+            skipped.append(day)
+            continue
+        records.extend(day_records)
+        if not args.json:
+            for record in day_records:
+                print(format_record(record))
+
+    estimates = complexity(records, declared) if args.sweep else None
+
+    if records and not args.no_history:
+        settings = {
+            "repeat": args.repeat, "warmup": args.warmup,
+            "sweep": args.sweep, "seed": args.seed, "startup": args.startup,
+            "strategies": args.strategies,
+        }
+        history.append(records, settings, baseline=args.baseline, file=args.history)
+
+    if args.json:
+        report = {"repeat": args.repeat, "warmup": args.warmup, "results": records, "skipped": skipped}
+        if estimates is not None:
+            report["complexity"] = estimates
+        if args.strategies:
+            report["mismatches"] = mismatches
+        print(json.dumps(report, indent=2))
+    else:
+        if estimates:
+            print("Empirical complexity:")
+            for estimate in estimates:
+                print(format_estimate(estimate))
+        if skipped:
+            reason = "No generator" if args.sweep else "No alternatives" if args.strategies else "No puzzle input"
+            print(f"{reason} for day(s):", ", ".join(f"{day:02d}" for day in skipped))
+
+    if mismatches or any(record.get("over_budget") for record in records):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
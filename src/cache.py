@@ -0,0 +1,100 @@
+"""
+On-disk cache of parsed puzzle inputs.
+An entry is the pickled result of parser(text). Its key is a hash of the
+input text and of the source code of the module that defines the parser,
+so editing the parser, or a data class it builds, invalidates the entry.
+The cache is bounded in size. When it grows too large, the least recently
+used entries are evicted. A hit refreshes the modification time of its file,
+so the file times serve as the LRU order.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "parsed"
+MAX_BYTES = 64 * 2 ** 20  # 64 MiB
+SUFFIX = ".pickle"
+
+
+class ParseCache:
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(parser: Callable[[str], Any], text: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(text.encode())
+        digest.update(f"{parser.__module__}.{parser.__qualname__}".encode())
+        digest.update(inspect.getsource(inspect.getmodule(parser)).encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / (key + SUFFIX)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return (True, value) on a hit, or (False, None) on a miss."""
+        file = self.path(key)
+        try:
+            with file.open("rb") as f:
+                value = pickle.load(f)
+            os.utime(file)  # mark as recently used
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+            file.unlink(missing_ok=True)  # written by an incompatible version
+            return False, None
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return  # not cacheable, e.g. holds a lambda
+        if len(data) > self.max_bytes:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that concurrent readers
+        # never see a partial entry
+        fd, temp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp, self.path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits into max_bytes."""
+        entries = []
+        for file in self.directory.glob("*" + SUFFIX):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:  # evicted by a concurrent process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, file in entries:
+            if total <= self.max_bytes:
+                break
+            file.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        for file in self.directory.glob("*" + SUFFIX):
+            file.unlink(missing_ok=True)
+
+    def parse(self, parser: Callable[[str], Any], text: str) -> tuple[Any, bool]:
+        """Return (parser(text), hit), taking the value from the cache if possible."""
+        key = self.key(parser, text)
+        hit, value = self.get(key)
+        if not hit:
+            value = parser(text)
+            self.put(key, value)
+        return value, hit
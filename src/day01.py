@@ -3,10 +3,24 @@ AdventOfCode 2025 Day 1
 https://adventofcode.com/2025/day/1
 """
 import configparser
+import os
 import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import reduce
+from itertools import accumulate, batched
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import runner
+
+if TYPE_CHECKING:
+    import numpy as np
 
 FULL_CIRCLE = 100  # 0 to 99
+START = 50  # where the dial points at first
+CHUNK_LINES = 100_000  # rotations per chunk in streaming mode
 
 
 def parse(puzzle_input: str) -> list[int]:
@@ -17,7 +31,7 @@ def parse(puzzle_input: str) -> list[int]:
 
 
 def solve(rotations: list[int]) -> tuple[int, int]:
-    dial = 50
+    dial = START
     zero_count = zero_transits = 0
     for rotation in rotations:
         # prepare for this step, both parts
@@ -30,8 +44,8 @@ def solve(rotations: list[int]) -> tuple[int, int]:
         # ... and now check if there is one final zero transit
         if dial != 0 and rotation > 0 and new_dial > FULL_CIRCLE:  # count zero visits for R
             zero_transits += 1  # case: add to non-null with carry
-        elif dial != 0 and rotation < 0 and new_dial < FULL_CIRCLE:  # count zero visits for L
-            zero_transits += 1  # case: subtract from non-null without carry
+        elif dial != 0 and rotation < 0 and dial < new_dial < FULL_CIRCLE:  # count zero visits for L
+            zero_transits += 1  # case: subtract from non-null without carry, not by full circles only
         elif new_dial == FULL_CIRCLE:  # count direct zero hits by L or R
             zero_transits += 1  # case: add or subtract with result being exactly null
 
@@ -42,6 +56,161 @@ def solve(rotations: list[int]) -> tuple[int, int]:
     return zero_count, zero_transits
 
 
+def solve_vectorized(rotations: "Sequence[int] | np.ndarray") -> tuple[int, int]:
+    """
+    Same as solve, but with NumPy on all rotations at once. The dial positions are
+    the cumulative sum of the rotations, not reduced to one circle. A rotation
+    passes zero once for every full circle between its start and end position.
+    A rotation to the left also counts zero when it ends there, but not when it
+    starts there, because these positions are the lower bound of their circle.
+    """
+    import numpy as np
+
+    steps = np.asarray(rotations, dtype=np.int64)
+    positions = np.empty(len(steps) + 1, dtype=np.int64)
+    positions[0] = START
+    np.cumsum(steps, out=positions[1:])
+    positions[1:] += START
+    circles, offsets = np.divmod(positions, FULL_CIRCLE)
+    at_zero = offsets == 0
+
+    # part 1
+    zero_count = np.count_nonzero(at_zero[1:])
+
+    # part 2
+    left = steps < 0
+    zero_transits = (
+        np.abs(np.diff(circles)).sum()
+        + np.count_nonzero(at_zero[1:] & left)
+        - np.count_nonzero(at_zero[:-1] & left)
+    )
+    return int(zero_count), int(zero_transits)
+
+
+@dataclass(frozen=True)
+class Summary:
+    """
+    The effect of a run of rotations, for every position the dial may start at:
+    the net rotation, and how often the dial lands on zero (part 1) or passes
+    zero (part 2). Summaries of consecutive runs combine with "+", which is
+    associative, so runs can be summarized independently and in any grouping.
+    """
+    offset: int  # net rotation modulo FULL_CIRCLE
+    landings: tuple[int, ...]  # indexed by start position
+    transits: tuple[int, ...]  # indexed by start position
+
+    def __add__(self, later: "Summary") -> "Summary":
+        shifted = [(start + self.offset) % FULL_CIRCLE for start in range(FULL_CIRCLE)]
+        return Summary(
+            (self.offset + later.offset) % FULL_CIRCLE,
+            tuple(self.landings[start] + later.landings[shifted[start]] for start in range(FULL_CIRCLE)),
+            tuple(self.transits[start] + later.transits[shifted[start]] for start in range(FULL_CIRCLE)),
+        )
+
+
+NO_ROTATION = Summary(0, (0,) * FULL_CIRCLE, (0,) * FULL_CIRCLE)
+
+
+def summarize(rotations: Iterable[int]) -> Summary:
+    """
+    Summarize the rotations in one pass. Relative to any start position, the dial
+    visits the same positions, only shifted. A rotation of magnitude m % FULL_CIRCLE
+    passes zero (beyond its full circles) from a cyclic interval of m start positions,
+    these intervals are collected in a difference array.
+    """
+    landings = [0] * FULL_CIRCLE
+    extra = [0] * (FULL_CIRCLE + 1)  # differences of the extra zero transits, by start position
+    full_circles = 0
+    offset = 0
+    for rotation in rotations:
+        full_circles += abs(rotation) // FULL_CIRCLE
+        magnitude = abs(rotation) % FULL_CIRCLE
+        if magnitude:
+            # R: the dial passes zero if it starts at FULL_CIRCLE - magnitude ... FULL_CIRCLE - 1
+            # L: the dial passes zero if it starts at 1 ... magnitude
+            first = (FULL_CIRCLE - magnitude - offset if rotation > 0 else 1 - offset) % FULL_CIRCLE
+            last = first + magnitude
+            extra[first] += 1
+            if last <= FULL_CIRCLE:
+                extra[last] -= 1
+            else:  # wraps around
+                extra[FULL_CIRCLE] -= 1
+                extra[0] += 1
+                extra[last - FULL_CIRCLE] -= 1
+        offset = (offset + rotation) % FULL_CIRCLE
+        landings[-offset % FULL_CIRCLE] += 1
+    transits = tuple(full_circles + count for count in accumulate(extra[:FULL_CIRCLE]))
+    return Summary(offset, tuple(landings), transits)
+
+
+def summarize_text(puzzle_input: str) -> Summary:
+    return summarize(parse(puzzle_input))
+
+
+def solve_chunked(rotations: Iterable[int], chunk_size: int = CHUNK_LINES) -> tuple[int, int]:
+    """Same as solve, but by summarizing chunks of rotations one after another."""
+    summary = reduce(Summary.__add__, map(summarize, batched(rotations, chunk_size)), NO_ROTATION)
+    return summary.landings[START], summary.transits[START]
+
+
+def join_chunks(lines: Iterable[str], chunk_lines: int = CHUNK_LINES) -> Iterator[str]:
+    """Join lines with their line ends into chunks of text, chunk_lines rotations each."""
+    for batch in batched(lines, chunk_lines):
+        yield "".join(batch)
+
+
+def read_chunks(file: Path, chunk_lines: int = CHUNK_LINES) -> Iterator[str]:
+    """Read the puzzle input lazily, chunk_lines rotations at a time."""
+    with file.open() as f:
+        yield from join_chunks(f, chunk_lines)
+
+
+def solve_stream(chunks: Iterable[str], workers: int | None = None) -> tuple[int, int]:
+    """
+    Same as solve, for puzzle input that comes in chunks of text, possibly more
+    than fits into memory. Each chunk is parsed and summarized in a worker process.
+    At most two chunks per worker are in flight, and the summaries are combined in
+    input order as soon as they arrive, so the memory needed does not grow with the input.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.process_cpu_count()
+    summary = NO_ROTATION
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(summarize_text, chunk))
+            if len(pending) >= 2 * workers:
+                summary += pending.popleft().result()
+        while pending:
+            summary += pending.popleft().result()
+    return summary.landings[START], summary.transits[START]
+
+
+def solve_part1(rotations: list[int]) -> int:
+    return solve(rotations)[0]
+
+
+def solve_part2(rotations: list[int]) -> int:
+    return solve(rotations)[1]
+
+
+def solve_part1_vectorized(rotations: "Sequence[int] | np.ndarray") -> int:
+    return solve_vectorized(rotations)[0]
+
+
+def solve_part2_vectorized(rotations: "Sequence[int] | np.ndarray") -> int:
+    return solve_vectorized(rotations)[1]
+
+
+runner.register(1, parse=parse, part1=solve_part1, part2=solve_part2)
+runner.register_strategy(1, 1, "chunked", lambda rotations: solve_chunked(rotations)[0])
+runner.register_strategy(1, 2, "chunked", lambda rotations: solve_chunked(rotations)[1])
+if runner.available("numpy"):
+    runner.register_strategy(1, 1, "numpy", solve_part1_vectorized)
+    runner.register_strategy(1, 2, "numpy", solve_part2_vectorized)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
@@ -57,8 +226,13 @@ def main() -> None:
 
     rotations = parse(example[0])
     part1test, part2test = solve(rotations)
+    # a few rotations per chunk, to combine many summaries
+    if solve_stream(join_chunks(example[0].splitlines(keepends=True), 3)) != (part1test, part2test):
+        print("Streaming solution does not match")
+        exit()
 
-    rotations = parse(Path(__file__).with_suffix(".txt").read_text())
+    file = Path(__file__).with_suffix(".txt")
+    rotations = parse(file.read_text())
     start = time.perf_counter()
     part1solution, part2solution = solve(rotations)
     end = time.perf_counter()
@@ -70,6 +244,14 @@ def main() -> None:
 
     print(f"runtime <= {(end - start) * 1000:.0f} ms")
 
+    start = time.perf_counter()
+    streamed = solve_stream(read_chunks(file))
+    end = time.perf_counter()
+    if streamed != (part1solution, part2solution):
+        print("Streaming solution does not match:", *streamed)
+        exit()
+    print(f"streaming runtime (parse included) <= {(end - start) * 1000:.0f} ms")
+
 
 if __name__ == "__main__":
     main()
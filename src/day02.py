@@ -16,12 +16,32 @@ and repeated sequences together must compose to a full match. For instance,
 123|123|123|4 isn't a full match, because there is an extra digit without a match.
 12|12|12|2|12 is not a match, because there is one incomplete sequence in the middle.
 1234|1234|123 is not a match because the last sequence is not complete.
+
+Instead of testing every number in a range, the matching numbers can be summed
+arithmetically. A number of length digits that repeats a block of size digits is
+block * (10^(length - size) + ... + 10^size + 1), so the matches of one length and
+block size are multiples of that repunit multiplier, and they add up as an arithmetic
+series. In part 2, a number may repeat several block sizes, for instance 111111 is
+1|1|1|1|1|1, 11|11|11 and 111|111. Inclusion-exclusion over the prime factors of
+the length counts each such number once.
+
+For many, possibly overlapping ranges, query() cuts the ranges at all of their
+bounds into disjoint segments, computes the sums of each covered segment once,
+and adds them up per range and for the union of the ranges.
 """
 import configparser
 import re
 import time
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import accumulate, combinations, pairwise
+from math import prod
 from pathlib import Path
 
+import runner
+
 
 def parse(text: str) -> list[tuple[int, int]]:
     result = []
@@ -41,6 +61,136 @@ def solve(id_ranges: list[tuple[int, int]], pattern: re.Pattern) -> int:
     return answer
 
 
+def repeated_sum(first: int, last: int, length: int, size: int) -> int:
+    """Sum of the numbers in [first, last] of length digits that repeat a block of size digits."""
+    multiplier = (10 ** length - 1) // (10 ** size - 1)
+    low = max(10 ** (size - 1), -(-first // multiplier))
+    high = min(10 ** size - 1, last // multiplier)
+    if low > high:
+        return 0
+    return multiplier * (low + high) * (high - low + 1) // 2
+
+
+def prime_factors(n: int) -> list[int]:
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            factors.append(p)
+            while n % p == 0:
+                n //= p
+        p += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def digit_segments(first: int, last: int) -> Iterator[tuple[int, int, int]]:
+    """Split [first, last] at the powers of ten into (first, last, length) of a fixed digit length."""
+    length = len(str(first))
+    while first <= last:
+        end = min(last, 10 ** length - 1)
+        yield first, end, length
+        first, length = end + 1, length + 1
+
+
+def segment_sums(first: int, last: int, length: int) -> tuple[int, int]:
+    """
+    The sums for part 1 and part 2 of the numbers in [first, last], which all have
+    length digits. Part 2 reuses the sum of part 1 for the blocks of half the length.
+    """
+    twice = repeated_sum(first, last, length, length // 2) if length % 2 == 0 else 0
+    any_times = 0
+    # a block repeated r times is also a block of the size length / p repeated,
+    # for every prime p dividing r, and numbers that repeat the blocks of
+    # several such sizes repeat the block of their greatest common divisor
+    primes = prime_factors(length)
+    for count in range(1, len(primes) + 1):
+        sign = 1 if count % 2 else -1
+        for subset in combinations(primes, count):
+            size = length // prod(subset)
+            any_times += sign * (twice if 2 * size == length else repeated_sum(first, last, length, size))
+    return twice, any_times
+
+
+def invalid_sum(first: int, last: int, any_repeats: bool) -> int:
+    """
+    Sum of the numbers in [first, last] that repeat a block twice, or any number of
+    times if any_repeats is set. The runtime depends on the number of digit lengths
+    in the range, not on its width.
+    """
+    return sum(segment_sums(*segment)[any_repeats] for segment in digit_segments(first, last))
+
+
+@dataclass(frozen=True)
+class RangeSums:
+    first: int
+    last: int
+    part1: int
+    part2: int
+
+
+@dataclass(frozen=True)
+class Query:
+    part1: int  # over the union of all ranges, every ID counts once
+    part2: int
+    ranges: list[RangeSums]  # in input order, IDs in overlaps count for every range
+
+
+def query(id_ranges: list[tuple[int, int]]) -> Query:
+    """
+    Answer both parts for the union of the ranges and for every range, in one pass.
+    The bounds of all ranges cut the ID axis into disjoint segments. The sums of
+    each segment that some range covers are computed once, and every range then
+    adds up the segments between its bounds with a difference of prefix sums.
+    """
+    bounds = sorted({first for first, _ in id_ranges} | {last + 1 for _, last in id_ranges})
+    coverage = Counter()
+    for first, last in id_ranges:
+        coverage[first] += 1
+        coverage[last + 1] -= 1
+
+    sums1, sums2 = [], []
+    depth = 0
+    for low, high in pairwise(bounds):
+        depth += coverage[low]
+        part1 = part2 = 0
+        if depth > 0:  # skip the gaps between the ranges
+            for segment in digit_segments(low, high - 1):
+                twice, any_times = segment_sums(*segment)
+                part1 += twice
+                part2 += any_times
+        sums1.append(part1)
+        sums2.append(part2)
+
+    prefix1 = [0, *accumulate(sums1)]
+    prefix2 = [0, *accumulate(sums2)]
+    ranges = []
+    for first, last in id_ranges:
+        i, j = bisect_left(bounds, first), bisect_left(bounds, last + 1)
+        ranges.append(RangeSums(first, last, prefix1[j] - prefix1[i], prefix2[j] - prefix2[i]))
+    return Query(prefix1[-1], prefix2[-1], ranges)
+
+
+def solve_part1(id_ranges: list[tuple[int, int]]) -> int:
+    return sum(invalid_sum(first, last, any_repeats=False) for first, last in id_ranges)
+
+
+def solve_part2(id_ranges: list[tuple[int, int]]) -> int:
+    return sum(invalid_sum(first, last, any_repeats=True) for first, last in id_ranges)
+
+
+runner.register(2, parse=parse, part1=solve_part1, part2=solve_part2)
+runner.register_strategy(2, 1, "query", lambda id_ranges: sum(r.part1 for r in query(id_ranges).ranges))
+runner.register_strategy(2, 2, "query", lambda id_ranges: sum(r.part2 for r in query(id_ranges).ranges))
+runner.register_strategy(2, 1, "regex", lambda id_ranges: solve(id_ranges, re.compile(r"([1-9][0-9]*)\1")))
+runner.register_strategy(2, 2, "regex", lambda id_ranges: solve(id_ranges, re.compile(r"([1-9][0-9]*)\1+")))
+runner.register_strategy(2, 1, "lazy", lambda id_ranges: solve(id_ranges, re.compile(r"([1-9][0-9]*?)\1")))
+runner.register_strategy(2, 1, "any digit", lambda id_ranges: solve(id_ranges, re.compile(r"(\d+)\1")))
+runner.register_strategy(2, 2, "lazy", lambda id_ranges: solve(id_ranges, re.compile(r"([1-9][0-9]*?)\1+")))
+runner.register_strategy(2, 2, "any digit", lambda id_ranges: solve(id_ranges, re.compile(r"(\d+)\1+")))
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
@@ -56,25 +206,21 @@ def main() -> None:
 
     example_ranges = parse(example[0])
 
-    part1pattern = re.compile(r"([1-9][0-9]*)\1")
-
-    assert solve(example_ranges, part1pattern) == example[1]
+    assert solve_part1(example_ranges) == example[1]
 
     text = Path(__file__).with_suffix(".txt").read_text()
     puzzle_ranges = parse(text)
 
     start = time.perf_counter()
-    part1solution = solve(puzzle_ranges, part1pattern)
+    part1solution = solve_part1(puzzle_ranges)
     end = time.perf_counter()
 
     print(f"Part 1 solution: {part1solution}, runtime = {end - start:.3f} s")
 
-    part2pattern = re.compile(r"([1-9][0-9]*)\1+")
-
-    assert solve(example_ranges, part2pattern) == example[2]
+    assert solve_part2(example_ranges) == example[2]
 
     start = time.perf_counter()
-    part2solution = solve(puzzle_ranges, part2pattern)
+    part2solution = solve_part2(puzzle_ranges)
     end = time.perf_counter()
 
     print(f"Part 2 solution: {part2solution}, runtime = {end - start:.3f} s")
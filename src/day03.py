@@ -3,9 +3,23 @@ AdventOfCode 2025 Day 3
 https://adventofcode.com/2025/day/3
 """
 import configparser
+import sys
 import time
 from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import runner
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INT64_DIGITS = 18  # decimal digits that always fit into an int64
+BATCH_ROWS = 65_536  # banks per batch, bounds the memory of the temporary arrays
+
+
+def parse(text: str) -> list[bytes]:
+    return text.encode().split()
 
 
 def find_max(segment: str, size: int) -> deque[int]:
@@ -43,20 +57,114 @@ def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     return text, part1_ex, part2_ex
 
 
-def solve(banks: list[str], size: int = 2) -> int:
+def digits_to_int(digits: bytes) -> int:
+    """Like int(digits), but also beyond the limit of sys.get_int_max_str_digits()."""
+    limit = sys.get_int_max_str_digits()
+    if not limit or len(digits) <= limit:
+        return int(digits)
+    half = len(digits) // 2
+    return digits_to_int(digits[:half]) * 10 ** (len(digits) - half) + digits_to_int(digits[half:])
+
+
+def max_joltage(bank: bytes, size: int) -> int:
+    """
+    The largest number made of size digits of the bank, in their order, in O(n).
+    Scan the digits with a stack that holds the best prefix so far. A greater digit
+    replaces the smaller ones on top of the stack, as long as enough digits remain
+    to fill size, i.e. at most len(bank) - size digits are dropped in total.
+    """
+    droppable = max(0, len(bank) - size)
+    stack = bytearray()
+    for digit in bank:
+        while droppable and stack and stack[-1] < digit:
+            stack.pop()
+            droppable -= 1
+        stack.append(digit)
+    return digits_to_int(bytes(stack[:size])) if size > 0 and stack else 0
+
+
+def solve(banks: list[bytes], size: int = 2) -> int:
+    return sum(max_joltage(bank, size) for bank in banks)
+
+
+def pick_digits(digits: "np.ndarray", size: int) -> "np.ndarray":
+    """
+    The digits of the largest subsequence of the given size, for every row of a
+    digit matrix at once. Pick k (0-based) is the leftmost maximum in the window
+    from the column after pick k - 1 up to the last column that leaves enough
+    columns for the remaining picks.
+    """
+    import numpy as np
+
+    rows, columns = digits.shape
+    picks = np.empty((rows, size), dtype=np.uint8)
+    start = np.zeros(rows, dtype=np.intp)
+    row_index = np.arange(rows)
+    for k in range(size):
+        low, high = start.min(), columns - size + k + 1
+        window = digits[:, low:high].astype(np.int8)
+        window[np.arange(low, high) < start[:, None]] = -1  # before the window of the row
+        best = low + window.argmax(axis=1)
+        picks[:, k] = digits[row_index, best]
+        start = best + 1
+    return picks
+
+
+def solve_batched(banks: list[bytes], size: int = 2) -> int:
+    """
+    Same as solve, but with NumPy on a batch of banks at once, if they all have the
+    same length. The picked digits are combined to numbers in int64 blocks of
+    INT64_DIGITS digits, and the blocks are summed up with Python ints, which do
+    not overflow.
+    """
+    import numpy as np
+
+    length = len(banks[0]) if banks else 0
+    if not 0 < size <= length or any(len(bank) != length for bank in banks):
+        return solve(banks, size)
+
+    answer = 0
+    for first in range(0, len(banks), BATCH_ROWS):
+        batch = banks[first: first + BATCH_ROWS]
+        digits = np.frombuffer(b"".join(batch), dtype=np.uint8).reshape(len(batch), length) - ord("0")
+        picks = pick_digits(digits, size).astype(np.int64)
+        for low in range(0, size, INT64_DIGITS):
+            block = picks[:, low: low + INT64_DIGITS]
+            weights = 10 ** np.arange(block.shape[1] - 1, -1, -1, dtype=np.int64)
+            answer += sum((block @ weights).tolist()) * 10 ** (size - low - block.shape[1])
+    return answer
+
+
+def solve_recursive(banks: list[bytes], size: int = 2) -> int:
     answer = 0
     for bank in banks:
-        answer += int("".join(map(str, find_max(bank, size))))
+        answer += int("".join(map(str, find_max(bank.decode(), size))))
     return answer
 
 
+def solve_part1(banks: list[bytes]) -> int:
+    return solve(banks)
+
+
+def solve_part2(banks: list[bytes]) -> int:
+    return solve(banks, size=12)
+
+
+runner.register(3, parse=parse, part1=solve_part1, part2=solve_part2)
+runner.register_strategy(3, 1, "recursive", lambda banks: solve_recursive(banks))
+runner.register_strategy(3, 2, "recursive", lambda banks: solve_recursive(banks, size=12))
+if runner.available("numpy"):
+    runner.register_strategy(3, 1, "numpy", lambda banks: solve_batched(banks))
+    runner.register_strategy(3, 2, "numpy", lambda banks: solve_batched(banks, size=12))
+
+
 def main() -> None:
 
     example = load_example(Path(__file__).with_suffix(".ini"))
 
-    assert solve(example[0].splitlines()) == example[1]
+    assert solve(parse(example[0])) == example[1]
 
-    puzzle_input = Path(__file__).with_suffix(".txt").read_text().splitlines()
+    puzzle_input = parse(Path(__file__).with_suffix(".txt").read_text())
 
     start = time.perf_counter()
     answer = solve(puzzle_input)
@@ -64,7 +172,7 @@ def main() -> None:
     print(f"Part 1 solution: {answer}, runtime = {end - start:.3f} s")
 
     size = 12
-    assert solve(example[0].splitlines(), size=size) == example[2]
+    assert solve(parse(example[0]), size=size) == example[2]
 
     start = time.perf_counter()
     answer = solve(puzzle_input, size=size)
@@ -6,9 +6,12 @@ import configparser
 import time
 from pathlib import Path
 
+import runner
+
 A_ROLL = "@"
 
 type Pair = tuple[int, int]  # (x, y)
+type Bitboard = list[int]  # bit x of row y is set if there is a roll at (x, y)
 
 
 def parse(puzzle_input: str) -> set[Pair]:
@@ -41,8 +44,7 @@ def count_neighbors(grid: set[Pair], roll: Pair):
     return count
 
 
-def solve_part1(puzzle_input: str) -> int:
-    grid = parse(puzzle_input)
+def solve_part1(grid: set[Pair]) -> int:
     answer = 0
     for roll in grid:
         if count_neighbors(grid, roll) < 4:
@@ -58,8 +60,39 @@ def find_removable_rolls(grid: set[Pair], neighbour_limit: int = 4) -> set[Pair]
     return candidates
 
 
-def solve_part2(puzzle_input: str) -> int:
-    grid = parse(puzzle_input)
+def peel(grid: set[Pair], neighbour_limit: int = 4) -> list[int]:
+    """
+    Remove the removable rolls round by round, like solve_part2, and return the
+    number of rolls removed in each round. The neighbour count of every roll is
+    computed once. A removal decrements the counts of its neighbours, and a
+    neighbour whose count drops below the limit joins the next round, so every
+    roll is looked at a constant number of times.
+    """
+    counts = {roll: count_neighbors(grid, roll) for roll in grid}
+    current = [roll for roll, count in counts.items() if count < neighbour_limit]
+    rounds = []
+    while current:
+        rounds.append(len(current))
+        for roll in current:
+            del counts[roll]
+        following = []
+        for x, y in current:
+            for dx, dy in NEIGHBOURSHIP:
+                neighbour = x + dx, y + dy
+                if neighbour in counts:
+                    counts[neighbour] -= 1
+                    if counts[neighbour] == neighbour_limit - 1:  # just dropped below the limit
+                        following.append(neighbour)
+        current = following
+    return rounds
+
+
+def solve_part2(grid: set[Pair]) -> int:
+    return sum(peel(grid))
+
+
+def solve_part2_rescan(grid: set[Pair]) -> int:
+    grid = set(grid)  # do not consume the caller's grid
     answer = 0
     while True:
         removable_rolls = find_removable_rolls(grid)
@@ -70,6 +103,66 @@ def solve_part2(puzzle_input: str) -> int:
     return answer
 
 
+def parse_bitboard(puzzle_input: str) -> Bitboard:
+    """Same as parse, but into one int per row, 1 bit per tile."""
+    table = str.maketrans({A_ROLL: "1", ".": "0"})
+    return [int(row.translate(table)[::-1] or "0", 2) for row in puzzle_input.splitlines()]
+
+
+def count_neighbour_bits(board: Bitboard, y: int) -> list[int]:
+    """
+    The neighbour counts of all tiles in row y at once, as 4 bit planes:
+    bit x of plane i is bit i of the count at (x, y). The eight neighbour
+    rows, shifted into place, are added with a ripple-carry adder.
+    """
+    above = board[y - 1] if y > 0 else 0
+    below = board[y + 1] if y + 1 < len(board) else 0
+    row = board[y]
+    planes = [0, 0, 0, 0]
+    for neighbours in (above << 1, above, above >> 1, row << 1, row >> 1, below << 1, below, below >> 1):
+        carry = neighbours
+        for i in range(len(planes)):
+            planes[i], carry = planes[i] ^ carry, planes[i] & carry
+    return planes
+
+
+def fewer_than(planes: list[int], limit: int) -> int:
+    """The bits where the count in the bit planes is less than limit."""
+    mask = 0
+    for count in range(min(limit, 1 << len(planes))):
+        equal = -1  # all bits set
+        for i, plane in enumerate(planes):
+            equal &= plane if count >> i & 1 else ~plane
+        mask |= equal
+    return mask
+
+
+def find_removable_bits(board: Bitboard, neighbour_limit: int = 4) -> Bitboard:
+    return [row & fewer_than(count_neighbour_bits(board, y), neighbour_limit) for y, row in enumerate(board)]
+
+
+def solve_part1_bitboard(board: Bitboard) -> int:
+    return sum(row.bit_count() for row in find_removable_bits(board))
+
+
+def solve_part2_bitboard(board: Bitboard) -> int:
+    answer = 0
+    while True:
+        removable_rolls = find_removable_bits(board)
+        removed = sum(row.bit_count() for row in removable_rolls)
+        if not removed:
+            break
+        board = [row & ~removable for row, removable in zip(board, removable_rolls)]
+        answer += removed
+    return answer
+
+
+runner.register(4, parse=parse, part1=solve_part1, part2=solve_part2)
+runner.register_strategy(4, 1, "bitboard", solve_part1_bitboard, parse=parse_bitboard)
+runner.register_strategy(4, 2, "rescan", solve_part2_rescan)
+runner.register_strategy(4, 2, "bitboard", solve_part2_bitboard, parse=parse_bitboard)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
@@ -84,16 +177,16 @@ def main() -> None:
 
     example = load_example(Path(__file__).with_suffix(".ini"))
 
-    assert solve_part1(example[0]) == example[1]
+    assert solve_part1(parse(example[0])) == example[1]
 
-    puzzle_input = Path(__file__).with_suffix(".txt").read_text()
+    puzzle_input = parse(Path(__file__).with_suffix(".txt").read_text())
 
     start = time.perf_counter()
     answer = solve_part1(puzzle_input)
     end = time.perf_counter()
     print(f"Part 1 solution: {answer}, runtime = {end - start:.3f} s")
 
-    assert solve_part2(example[0]) == example[2]
+    assert solve_part2(parse(example[0])) == example[2]
 
     start = time.perf_counter()
     answer = solve_part2(puzzle_input)
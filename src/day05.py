@@ -5,10 +5,17 @@ https://adventofcode.com/2025/day/5
 import configparser
 import re
 import time
+from bisect import bisect_left, bisect_right
 from collections import deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import runner
+
+if TYPE_CHECKING:
+    import numpy as np
 
 type SortableSequence = list | deque
 type Bounds = tuple[int, int]  # (lower, upper)
@@ -32,7 +39,7 @@ def parse(database: str) -> tuple[IngredientRanges, IngredientList]:
     return ingredient_ranges, ingredients
 
 
-def solve_part1(ingredient_ranges: IngredientRanges, ingredients: IngredientList) -> int:
+def solve_part1_linear(ingredient_ranges: IngredientRanges, ingredients: IngredientList) -> int:
     count = 0
     for ingred in ingredients:
         for irlow, irhigh in ingredient_ranges:
@@ -46,7 +53,7 @@ def merge(ranges: IngredientRanges) -> IngredientRanges:
     if not ranges:
         return []
 
-    ranges.sort(key=lambda x: x[0])
+    ranges = sorted(ranges, key=lambda x: x[0])  # do not sort the caller's list
 
     merged = []
     current_start, current_end = ranges[0]
@@ -84,12 +91,113 @@ def ugly_merge(ranges: IngredientRanges) -> IngredientRanges:
     return left
 
 
+class IntervalIndex:
+    """
+    Membership queries against inclusive ranges. The ranges are merged into sorted,
+    disjoint ones, so an ID is in a range if it is not past the end of the last
+    range that starts at or before it. That range is found by binary search.
+    """
+
+    def __init__(self, ranges: IngredientRanges, mergefunc: RangeMerger = merge) -> None:
+        merged = mergefunc(ranges)
+        self.starts = [low for low, _ in merged]
+        self.ends = [high for _, high in merged]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, ingredient: int) -> bool:
+        i = bisect_right(self.starts, ingredient) - 1
+        return i >= 0 and ingredient <= self.ends[i]
+
+    def count(self, ingredients: Iterable[int]) -> int:
+        return sum(ingredient in self for ingredient in ingredients)
+
+    def contains_all(self, ingredients: "Iterable[int] | np.ndarray") -> "np.ndarray":
+        """Membership of many IDs at once, as a boolean array, with numpy.searchsorted."""
+        import numpy as np
+
+        ids = np.asarray(ingredients, dtype=np.int64)
+        if not self.starts:
+            return np.zeros(ids.shape, dtype=bool)
+        starts = np.asarray(self.starts, dtype=np.int64)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        i = np.searchsorted(starts, ids, side="right") - 1
+        return (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+
+
+class IntervalSet:
+    """
+    A set of IDs, made of inclusive ranges that can be added one at a time,
+    with queries in between. The ranges are kept sorted and disjoint. A new range
+    absorbs the ranges it overlaps or touches, found by binary search, and the
+    covered length is updated by the difference, so no range is ever merged twice.
+    Splicing the lists moves their tail in memory, which is O(n), but cheap.
+    """
+
+    def __init__(self, ranges: Iterable[Bounds] = ()) -> None:
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.covered = 0  # number of IDs in the set
+        for low, high in ranges:
+            self.add(low, high)
+
+    def add(self, low: int, high: int) -> None:
+        i = bisect_left(self.ends, low - 1)  # the first range that ends at low - 1 or later
+        j = bisect_right(self.starts, high + 1)  # past the last range that starts at high + 1 or earlier
+        if i == j:  # a new range of its own
+            self.starts.insert(i, low)
+            self.ends.insert(i, high)
+            self.covered += high - low + 1
+            return
+        low = min(low, self.starts[i])
+        high = max(high, self.ends[j - 1])
+        self.covered += high - low + 1 - sum(self.ends[k] - self.starts[k] + 1 for k in range(i, j))
+        self.starts[i:j] = [low]
+        self.ends[i:j] = [high]
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, ingredient: int) -> bool:
+        i = bisect_right(self.starts, ingredient) - 1
+        return i >= 0 and ingredient <= self.ends[i]
+
+    def __iter__(self) -> Iterator[Bounds]:
+        return zip(self.starts, self.ends)
+
+
+def solve_part1(ingredient_ranges: IngredientRanges, ingredients: IngredientList) -> int:
+    return IntervalIndex(ingredient_ranges).count(ingredients)
+
+
+def solve_part1_vectorized(ingredient_ranges: IngredientRanges, ingredients: IngredientList) -> int:
+    return int(IntervalIndex(ingredient_ranges).contains_all(ingredients).sum())
+
+
 def solve_part2(ingredient_ranges: IngredientRanges, mergefunc: RangeMerger) -> int:
     merged = mergefunc(ingredient_ranges)
     answer = sum(b - a + 1 for a, b in merged)
     return answer
 
 
+def solve_part2_online(ingredient_ranges: IngredientRanges) -> int:
+    return IntervalSet(ingredient_ranges).covered
+
+
+runner.register(
+    5,
+    parse=parse,
+    part1=lambda database: solve_part1(*database),
+    part2=lambda database: solve_part2(database[0], merge),
+)
+runner.register_strategy(5, 1, "linear", lambda database: solve_part1_linear(*database))
+if runner.available("numpy"):
+    runner.register_strategy(5, 1, "numpy", lambda database: solve_part1_vectorized(*database))
+runner.register_strategy(5, 2, "online", lambda database: solve_part2_online(database[0]))
+runner.register_strategy(5, 2, "ugly_merge", lambda database: solve_part2(database[0], ugly_merge))
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
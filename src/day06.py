@@ -3,18 +3,31 @@ AdventOfCode 2025 Day 6
 https://adventofcode.com/2025/day/6
 """
 import configparser
+import mmap
 import operator
 import re
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from functools import reduce
+from math import prod
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import runner
+
+if TYPE_CHECKING:
+    import numpy as np
 
 type Problem = tuple[str] | list[str]
 type ProblemList = tuple[Problem] | list[Problem]
 type ParseFunc = Callable[[str], ProblemList]
+type Buffer = bytes | mmap.mmap
+type Span = tuple[int, int, int]  # (first column, end column, operator byte)
 
-PATTERN = re.compile(r"([+*]\s*)")
+PATTERN = r"([+*]\s*)"  # compiled (and cached) by re on first use
+SPACE, ZERO, NEWLINE, PLUS = b" 0\n+"
+INT64_DIGITS = 18  # decimal digits that always fit into an int64
 
 
 def parse_for_part1(text: str) -> ProblemList:
@@ -25,7 +38,7 @@ def parse_for_part1(text: str) -> ProblemList:
     followed by an operator.
     """
     lines = [line + " " for line in text.splitlines()]
-    operators = PATTERN.findall(lines[-1])
+    operators = re.findall(PATTERN, lines[-1])
     sizes = [len(op) - 1 for op in operators]
 
     rows = []
@@ -80,11 +93,193 @@ def solve(puzzle_input: str, parse: ParseFunc) -> int:
     return answer
 
 
+@dataclass(frozen=True)
+class Worksheet:
+    """
+    The worksheet as one buffer of equal length lines. The tile in row r and
+    column c is the byte at r * stride + c, with the operators in the last row.
+    """
+    data: Buffer
+    width: int
+    stride: int  # width + 1 for the newline
+    rows: int  # rows of numbers, without the operator row
+
+
+def read_worksheet(data: Buffer) -> Worksheet:
+    """Take the bytes as they are, unless the lines differ in length, then pad them."""
+    width = data.find(b"\n")
+    if width < 0:
+        width = len(data)
+    stride = width + 1
+    lines = (len(data) + 1) // stride
+    if len(data) not in (lines * stride, lines * stride - 1) or any(
+            data[line * stride + width] != NEWLINE for line in range(lines - 1)):
+        lines = bytes(data).splitlines()
+        width = max(map(len, lines))
+        return read_worksheet(b"\n".join(line.ljust(width) for line in lines))
+    return Worksheet(data, width, stride, lines - 1)
+
+
+def spans(sheet: Worksheet) -> Iterator[Span]:
+    """
+    The columns of each problem, from the positions of the operators. A problem
+    ends one column before the next operator, that column only holds spaces.
+    """
+    base = sheet.rows * sheet.stride
+    first = None
+    for column in range(sheet.width):
+        tile = sheet.data[base + column]
+        if tile != SPACE:
+            if first is not None:
+                yield first, column - 1, sheet.data[base + first]
+            first = column
+    if first is not None:
+        yield first, sheet.width, sheet.data[base + first]
+
+
+def row_numbers(sheet: Worksheet, span: Span) -> Iterator[int]:
+    """The numbers of a problem, one per row."""
+    first, end, _ = span
+    data = sheet.data
+    for offset in range(0, sheet.rows * sheet.stride, sheet.stride):
+        number = 0
+        for i in range(offset + first, offset + end):
+            if data[i] != SPACE:
+                number = number * 10 + data[i] - ZERO
+        yield number
+
+
+def column_numbers(sheet: Worksheet, span: Span) -> Iterator[int]:
+    """The numbers of a problem in cephalopod math, one per column, digits from top to bottom."""
+    first, end, _ = span
+    data = sheet.data
+    offsets = range(0, sheet.rows * sheet.stride, sheet.stride)
+    for column in range(first, end):
+        number = 0
+        for offset in offsets:
+            if data[offset + column] != SPACE:
+                number = number * 10 + data[offset + column] - ZERO
+        yield number
+
+
+def solve_worksheet(sheet: Worksheet, cephalopod: bool = False) -> int:
+    """Same as solve, by index arithmetic on the worksheet buffer, without building strings."""
+    numbers = column_numbers if cephalopod else row_numbers
+    answer = 0
+    for span in spans(sheet):
+        if span[2] == PLUS:
+            answer += sum(numbers(sheet, span))
+        else:
+            answer += reduce(operator.mul, numbers(sheet, span), 1)
+    return answer
+
+
+def reduce_problems(operands: "np.ndarray", offsets: "np.ndarray", multiply: "np.ndarray") -> int:
+    """
+    Add or multiply the operands of every problem in bulk. The operands of problem i
+    start at offsets[i] and end where the next problem starts. A result can overflow
+    int64, so its number of digits is estimated first, for a product with a sum of
+    logarithms, for a sum from the largest operand and the number of operands.
+    Problems that might not fit are solved with Python ints instead.
+    """
+    import numpy as np
+
+    sums = np.add.reduceat(operands, offsets)
+    products = np.multiply.reduceat(operands, offsets)
+    counts = np.diff(offsets, append=len(operands))
+    with np.errstate(divide="ignore"):  # log10(0) is -inf, the result is 0 then
+        product_digits = np.add.reduceat(np.log10(operands.astype(np.float64)), offsets)
+        largest = np.maximum.reduceat(operands, offsets).astype(np.float64)
+        sum_digits = np.log10(largest) + np.log10(counts)
+    fits = np.where(multiply, product_digits, sum_digits) < INT64_DIGITS
+    answer = sum(sums[~multiply & fits].tolist()) + sum(products[multiply & fits].tolist())
+    ends = [*offsets[1:].tolist(), len(operands)]
+    for i in np.flatnonzero(~fits).tolist():
+        numbers = operands[offsets[i]: ends[i]].tolist()
+        answer += prod(numbers) if multiply[i] else sum(numbers)
+    return answer
+
+
+def solve_vectorized(sheet: Worksheet, cephalopod: bool = False) -> int:
+    """
+    Same as solve_worksheet, with NumPy on all problems at once. The digit rows become
+    a uint8 matrix with a blank mask. A digit is worth 10 to the power of the number
+    of digits after it, to its right in the same problem, or below it in cephalopod
+    math, counted with cumulative sums. The operands are the weighted sums of the
+    digits along the rows, or the columns.
+    """
+    import numpy as np
+
+    size = (sheet.rows + 1) * sheet.stride
+    grid = np.frombuffer(sheet.data, dtype=np.uint8, count=min(size, len(sheet.data)))
+    grid = np.pad(grid, (0, size - len(grid)), constant_values=NEWLINE)  # the last line may lack its newline
+    grid = grid.reshape(sheet.rows + 1, sheet.stride)[:, :sheet.width]
+    operators = grid[-1]
+    grid = grid[:-1]
+
+    # the problems, like spans(sheet)
+    firsts = np.flatnonzero(operators != SPACE)
+    ends = np.append(firsts[1:] - 1, sheet.width)
+    multiply = operators[firsts] != PLUS
+    if not len(firsts):
+        return 0
+    if (ends - firsts).max() > INT64_DIGITS or sheet.rows > INT64_DIGITS:  # operands might not fit into an int64
+        return solve_worksheet(sheet, cephalopod)
+    span_ends = np.repeat(ends, np.diff(firsts, append=sheet.width))  # by column, the separators included
+
+    digit = ~(grid == SPACE)
+    values = np.where(digit, grid - ZERO, 0).astype(np.int64)
+
+    if cephalopod:
+        after = np.cumsum(digit[::-1], axis=0)[::-1] - digit  # digits below, in the same column
+        numbers = (values * 10 ** after).sum(axis=0)
+        columns = np.arange(sheet.width) < span_ends  # not a separator
+        offsets = np.concatenate(([0], np.cumsum(ends - firsts)[:-1]))
+        return reduce_problems(numbers[columns], offsets, multiply)
+
+    counts = np.zeros((sheet.rows, sheet.width + 1), dtype=np.int64)
+    counts[:, :-1] = np.cumsum(digit[:, ::-1], axis=1)[:, ::-1]  # digits from here to the right end
+    after = counts[:, :-1] - counts[:, span_ends] - digit  # digits to the right, in the same problem
+    numbers = np.add.reduceat(values * 10 ** np.maximum(after, 0), firsts, axis=1)  # rows x problems
+    offsets = np.arange(0, numbers.size, sheet.rows)
+    return reduce_problems(numbers.T.ravel(), offsets, multiply)
+
+
+def solve_file(file: Path, cephalopod: bool = False) -> int:
+    """Solve a worksheet in a file, memory mapped rather than read."""
+    with file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return solve_worksheet(read_worksheet(data), cephalopod)
+
+
+def solve_part1(puzzle_input: str) -> int:
+    return solve(puzzle_input, parse_for_part1)
+
+
+def solve_part2(puzzle_input: str) -> int:
+    return solve(puzzle_input, parse_for_part2)
+
+
+EDGE_CASES = {  # sums that overflow int64, though each operand fits
+    "long rows": "\n".join(["9" * 18] * 10 + ["+".ljust(18)]) + "\n",
+    "long columns": "\n".join(["9" * 10] * 18 + ["+".ljust(10)]) + "\n",
+}
+
+runner.register(6, part1=solve_part1, part2=solve_part2, edge_cases=EDGE_CASES)
+runner.register_strategy(6, 1, "bytes", lambda text: solve_worksheet(read_worksheet(text.encode())))
+runner.register_strategy(6, 2, "bytes", lambda text: solve_worksheet(read_worksheet(text.encode()), cephalopod=True))
+if runner.available("numpy"):
+    runner.register_strategy(6, 1, "numpy", lambda text: solve_vectorized(read_worksheet(text.encode())))
+    runner.register_strategy(
+        6, 2, "numpy", lambda text: solve_vectorized(read_worksheet(text.encode()), cephalopod=True))
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
         example.read_file(f)
     text = example["Example"].get("text", None)
+    if text is not None:
+        text = text.replace("_", " ")  # spaces are significant, the .ini file shows them as "_"
     part1_ex = example["Example"].getint("part1", None)
     part2_ex = example["Example"].getint("part2", None)
     return text, part1_ex, part2_ex
@@ -94,24 +289,31 @@ def main() -> None:
 
     example = load_example(Path(__file__).with_suffix(".ini"))
 
-    if solve(example[0].replace("_", " "), parse_for_part1) != example[1]:
+    if solve(example[0], parse_for_part1) != example[1]:
         print("Part 1 not done")
         exit()
 
-    puzzle_input = Path(__file__).with_suffix(".txt").read_text()
+    file = Path(__file__).with_suffix(".txt")
+    puzzle_input = file.read_text()
 
     start = time.perf_counter()
     answer = solve(puzzle_input, parse_for_part1)
     end = time.perf_counter()
+    if solve_file(file) != answer:
+        print("Part 1 solution from the memory mapped file does not match")
+        exit()
     print(f"Part 1 solution: {answer}, runtime = {end - start:.3f} s")
 
-    if solve(example[0].replace("_", " "), parse_for_part2) != example[2]:
+    if solve(example[0], parse_for_part2) != example[2]:
         print("Part 2 not done")
         exit()
 
     start = time.perf_counter()
     answer = solve(puzzle_input, parse_for_part2)
     end = time.perf_counter()
+    if solve_file(file, cephalopod=True) != answer:
+        print("Part 2 solution from the memory mapped file does not match")
+        exit()
     print(f"Part 2 solution: {answer}, runtime = {end - start:.3f} s")
 
 
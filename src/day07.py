@@ -6,14 +6,19 @@ import configparser
 import copy
 import time
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Final, LiteralString
 
+import runner
+
 SPACE: Final[LiteralString] = "."
 SOURCEBEAM: Final[LiteralString] = "S"
 BEAM: Final[LiteralString] = "|"
 SPLITTER: Final[LiteralString] = "^"
+SPLITTER_BITS = str.maketrans({SPACE: "0", SOURCEBEAM: "0", BEAM: "0", SPLITTER: "1", "\n": None})
 
 
 @dataclass
@@ -23,7 +28,7 @@ class Manifold:
     splitters: dict[int, set[int]] = field(
         init=False, default_factory=lambda: defaultdict(set))
     pathcounts: dict[int, dict[int, int]] = field(
-        init=False, default_factory=lambda: defaultdict(lambda: defaultdict(int)))
+        init=False, default_factory=lambda: defaultdict(partial(defaultdict, int)))
 
     def set_initial_beam(self, x: int, y: int) -> None:
         self.initial_beam = x
@@ -76,6 +81,121 @@ def solve(manifold: Manifold) -> tuple[int, int]:
     return total_splits, total_paths
 
 
+def propagate(initial_beam: int, levels: Iterable[Iterable[int]]) -> tuple[int, int]:
+    """
+    Same as solve, for the source beam at column initial_beam and the splitter
+    columns of each level below it. Only the path counts of the current level are
+    kept, in a list indexed by column + 1 (a beam may leave at column -1), and
+    updated in place, level by level. The list grows with the width, not the depth.
+    """
+    pathcounts = [0] * (initial_beam + 3)
+    pathcounts[initial_beam + 1] = 1
+    total_splits = 0
+    for splitters in levels:
+        for x in splitters:
+            if x + 2 >= len(pathcounts):
+                pathcounts.extend([0] * (x + 3 - len(pathcounts)))
+            paths = pathcounts[x + 1]
+            if paths:  # a beam hits the splitter
+                total_splits += 1
+                pathcounts[x + 1] = 0
+                pathcounts[x] += paths
+                pathcounts[x + 2] += paths
+    return total_splits, sum(pathcounts)
+
+
+def splitter_columns(row: str) -> Iterator[int]:
+    x = row.find(SPLITTER)
+    while x >= 0:
+        yield x
+        x = row.find(SPLITTER, x + 1)
+
+
+def solve_rows(rows: Iterable[str]) -> tuple[int, int]:
+    """
+    Same as solve, for the rows of the manifold as they come, for instance the lines
+    of an open file, so that a manifold of any depth needs memory for one row only.
+    """
+    rows = iter(rows)
+    for row in rows:
+        initial_beam = row.find(SOURCEBEAM)
+        if initial_beam >= 0:
+            return propagate(initial_beam, map(splitter_columns, rows))
+    return 0, 0
+
+
+def solve_file(file: Path) -> tuple[int, int]:
+    with file.open() as f:
+        return solve_rows(f)
+
+
+def count_splits(initial_beam: int, levels: Iterable[int]) -> int:
+    """
+    Part 1 only, with the beams and the splitters of each level as int bitmasks:
+    bit x + 1 stands for column x, so that a beam may leave at column -1.
+    Every level is a few bitwise operations on the whole width at once.
+    """
+    beams = 1 << (initial_beam + 1)
+    total_splits = 0
+    for splitters in levels:
+        hits = beams & splitters
+        if hits:
+            total_splits += hits.bit_count()
+            beams = beams & ~hits | hits << 1 | hits >> 1
+    return total_splits
+
+
+def splitter_mask(row: str) -> int:
+    bits = row.translate(SPLITTER_BITS)[::-1]  # column 0 is the lowest bit
+    return int(bits + "0", 2)  # shifted by one, for column -1
+
+
+def count_splits_rows(rows: Iterable[str]) -> int:
+    """Same as count_splits, for the rows of the manifold as they come."""
+    rows = iter(rows)
+    for row in rows:
+        initial_beam = row.find(SOURCEBEAM)
+        if initial_beam >= 0:
+            return count_splits(initial_beam, map(splitter_mask, rows))
+    return 0
+
+
+def level_mask(columns: Iterable[int], width: int) -> int:
+    """The bitmask of splitter_mask, from the splitter columns of a level."""
+    bits = bytearray(b"0" * (width + 1))
+    for x in columns:
+        bits[width - 1 - x] = ord("1")
+    return int(bits, 2)
+
+
+def solve_bitset(manifold: Manifold) -> int:
+    width = max((max(columns) + 1 for columns in manifold.splitters.values() if columns), default=0)
+    levels = (level_mask(manifold.splitters.get(level, ()), width) for level in range(1, manifold.depth))
+    return count_splits(manifold.initial_beam, levels)
+
+
+def solve_rolling(manifold: Manifold) -> tuple[int, int]:
+    levels = (manifold.splitters.get(level, ()) for level in range(1, manifold.depth))
+    return propagate(manifold.initial_beam, levels)
+
+
+def solve_part1(manifold: Manifold) -> int:
+    return solve_rolling(manifold)[0]
+
+
+def solve_part2(manifold: Manifold) -> int:
+    return solve_rolling(manifold)[1]
+
+
+runner.register(7, parse=parse, part1=solve_part1, part2=solve_part2)
+runner.register_strategy(7, 1, "levels", lambda manifold: solve(manifold)[0])
+runner.register_strategy(7, 1, "bitset", solve_bitset)
+runner.register_strategy(7, 1, "bitset rows", count_splits_rows, parse=str.splitlines)
+runner.register_strategy(7, 1, "rows", lambda rows: solve_rows(rows)[0], parse=str.splitlines)
+runner.register_strategy(7, 2, "levels", lambda manifold: solve(manifold)[1])
+runner.register_strategy(7, 2, "rows", lambda rows: solve_rows(rows)[1], parse=str.splitlines)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
@@ -96,11 +216,17 @@ def main() -> None:
         print("Part 1 not done")
         exit()
 
-    manifold = parse(Path(__file__).with_suffix(".txt").read_text())
+    file = Path(__file__).with_suffix(".txt")
+    manifold = parse(file.read_text())
 
     start = time.perf_counter()
     part1, part2 = solve(manifold)
     end = time.perf_counter()
+
+    if solve_file(file) != (part1, part2):
+        print("Solution from the file rows does not match")
+        exit()
+
     print(f"Part 1 solution: {part1}")
 
     if solve(ex_manifold)[1] != example[2]:
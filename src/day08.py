@@ -3,15 +3,18 @@ AdventOfCode 2025 Day 8
 https://adventofcode.com/2025/day/8
 """
 import configparser
+import heapq
 import math
 import time
-from collections import deque
+from array import array
 from itertools import combinations
 from pathlib import Path
 
+import runner
+
 type Vector = tuple[int, int, int]  # v = (x, y, z)
 type NodeId = int
-type Circuit = set[NodeId]
+type Edge = tuple[int, NodeId, NodeId]  # (squared distance, i, j)
 
 
 def parse(text: str) -> set[Vector]:
@@ -25,66 +28,81 @@ def squared_distance(p: Vector, q: Vector) -> int:
     return abs(p[0] - q[0]) ** 2 + abs(p[1] - q[1]) ** 2 + abs(p[2] - q[2]) ** 2
 
 
+class DisjointSet:
+    """
+    Circuits of nodes 0 ... count - 1, as a forest of parent links in a flat array.
+    Union by size keeps the trees shallow, and find halves the path it walks,
+    so a sequence of operations takes near-linear time.
+    """
+
+    def __init__(self, count: int) -> None:
+        self.parent = array("l", range(count))
+        self.size = array("l", [1]) * count  # only valid for roots
+        self.components = count
+
+    def find(self, node: NodeId) -> NodeId:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # path halving
+            node = parent[node]
+        return node
+
+    def union(self, a: NodeId, b: NodeId) -> bool:
+        """Connect the circuits of a and b. Tell whether they were apart before."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def sizes(self) -> list[int]:
+        return [self.size[node] for node in range(len(self.parent)) if self.parent[node] == node]
+
+
+def edges(nodes: list[Vector]) -> list[Edge]:
+    return [
+        (squared_distance(p, q), i, j)
+        for (i, p), (j, q) in combinations(enumerate(nodes), 2)
+    ]
+
+
 def solve(vectors: set[Vector], limit: int | None = None) -> int:
     """
     This solves part 1 if the limit is set.
     This solves part 2 if the limit is not set.
+    Kruskal: connect the closest pairs first. Part 1 only needs the limit
+    closest pairs, part 2 pops pairs from a heap until one circuit is left.
     """
-    nodes = {i: j for i, j in enumerate(vectors)}
-    connection_by_cost = {
-        squared_distance(p, q): {i, j}
-        for (i, p), (j, q) in combinations(nodes.items(), 2)
-    }
-    ranks = sorted(connection_by_cost.keys())
-
-    circuits = deque()
-    circuits.append(connection_by_cost[ranks[0]])
-    last_seen = list(circuits[0])
-    singles = set(nodes.keys())
-
-    for i, current_rank in enumerate(ranks[1:], 1):
-        if i == limit or not singles:  # limit: part 1, singles: part 2
-            break
-
-        connection = connection_by_cost[current_rank]
-        singles -= connection
-        last_seen = list(connection)  # part 2
-
-        connect(circuits, connection)
-        merge(circuits)
-
-    # part 1:
-    # add vectors that are still unconnected
-    # just to be sure to catch all circuits for part 1
-    # (this is due to a remark in the explanation of AoCs part 1 example)
-    for single in singles:
-        circuits.append({single})
-
-    circuit_sizes = sorted([len(circuit) for circuit in circuits], reverse=True)  # part 1
-    part1 = math.prod(circuit_sizes[:3])
-
-    n1, n2 = last_seen  # part 2
-    part2 = nodes[n1][0] * nodes[n2][0]
-
-    return part1 if limit is not None else part2
-
-
-def merge(circuits: deque[Circuit]) -> None:
-    for c1, c2 in combinations(circuits, 2):
-        if c1 & c2:
-            connected_circuit = c1 | c2
-            circuits.remove(c1)
-            circuits.remove(c2)
-            circuits.append(connected_circuit)
-
-
-def connect(circuits: deque[Circuit], new_pair: Circuit) -> None:
-    for circuit in circuits:
-        if circuit & new_pair:
-            circuit |= new_pair
-            break
-    else:
-        circuits.append(new_pair)
+    nodes = list(vectors)
+    circuits = DisjointSet(len(nodes))
+
+    if limit is not None:  # part 1
+        for _, i, j in heapq.nsmallest(limit, edges(nodes)):
+            circuits.union(i, j)
+        return math.prod(sorted(circuits.sizes(), reverse=True)[:3])
+
+    queue = edges(nodes)  # part 2
+    heapq.heapify(queue)
+    while queue:
+        _, i, j = heapq.heappop(queue)
+        if circuits.union(i, j) and circuits.components == 1:
+            return nodes[i][0] * nodes[j][0]
+    return 0  # a single node is connected already
+
+
+def solve_part1(vectors: set[Vector], limit: int = 1000) -> int:
+    return solve(vectors, limit)
+
+
+def solve_part2(vectors: set[Vector]) -> int:
+    return solve(vectors)
+
+
+runner.register(8, parse=parse, part1=solve_part1, part2=solve_part2)
 
 
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
@@ -13,6 +13,8 @@ import time
 from itertools import combinations
 from pathlib import Path
 
+import runner
+
 type Pixel = tuple[int, int]  # (x, y) as pixel index
 type PixelList = list[Pixel]
 
@@ -114,6 +116,9 @@ def solve_part2(pixels: PixelList) -> int:
     return max_area
 
 
+runner.register(9, parse=parse, part1=solve_part1, part2=solve_part2)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from itertools import combinations
 from pathlib import Path
 
-import z3
+import runner
 
 
 @dataclass(kw_only=True)
@@ -90,6 +90,8 @@ def solve_part2(machines: list[Machine]) -> int:
     I suggest you consider subscribing to 0xdf's YT channel or,
     at least, give his day 10 video a like.
     """
+    import z3  # importing z3 takes longer than everything else, so only do it when needed
+
     answer = 0
 
     for machine in machines:
@@ -116,6 +118,9 @@ def solve_part2(machines: list[Machine]) -> int:
     return answer
 
 
+runner.register(10, parse=parse, part1=solve_part1, part2=solve_part2)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser(delimiters=('=',), comment_prefixes=(';',))
     with open(file) as f:
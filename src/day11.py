@@ -8,6 +8,8 @@ from collections.abc import Callable
 from functools import cache
 from pathlib import Path
 
+import runner
+
 
 def parse(text: str) -> dict[str, list[str]]:
     """
@@ -72,6 +74,9 @@ def solve_part2(fanouts: dict[str, list[str]]) -> int:
     return count_paths("svr", first) * count_paths(first, second) * count_paths(second, "out")
 
 
+runner.register(11, parse=parse, part1=solve_part1, part2=solve_part2)
+
+
 def load_example(file: Path) -> tuple[str | None, str | None, int | None, int | None]:
     example = configparser.ConfigParser()
     with open(file) as f:
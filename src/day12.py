@@ -20,6 +20,8 @@ import configparser
 import time
 from pathlib import Path
 
+import runner
+
 type Shapes = dict[int, list[str]]  # key: shape ID, value: list of shape segments (lines)
 type Regions = list[tuple[int, int, list[int]]]  # list of (width, length, list of shape requirements)
 
@@ -56,6 +58,9 @@ def solve(puzzle_input: tuple[Shapes, Regions]) -> int:
     return count
 
 
+runner.register(12, parse=parse, part1=solve)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser(delimiters=('=',), comment_prefixes=(';',))
     with open(file) as f:
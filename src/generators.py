@@ -0,0 +1,242 @@
+"""
+Synthetic puzzle inputs of configurable size for every day.
+Each generator takes a size and a random number generator and returns
+puzzle text in the same format as the real dayNN.txt. The meaning of
+"size" depends on the day, see the docstrings. The same seed always
+gives the same text.
+"""
+import random
+import string
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import isqrt
+
+type Generator = Callable[[int, random.Random], str]
+
+
+def rotations(size: int, rng: random.Random) -> str:
+    """Day 1: size rotations, like "L68" or "R48"."""
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size)) + "\n"
+
+
+def id_ranges(size: int, rng: random.Random) -> str:
+    """Day 2: disjoint ID ranges that cover about size IDs in total."""
+    ranges = []
+    cursor = 10
+    remaining = size
+    while remaining > 0:
+        width = min(remaining, rng.randint(1, 5_000))
+        cursor += rng.randint(0, 10 ** rng.randint(1, 9))
+        ranges.append(f"{cursor}-{cursor + width - 1}")
+        cursor += width
+        remaining -= width
+    return ",".join(ranges) + "\n"
+
+
+def banks(size: int, rng: random.Random) -> str:
+    """Day 3: size banks of 100 batteries (digits 1 to 9) each."""
+    return "\n".join(
+        "".join(rng.choice("123456789") for _ in range(100)) for _ in range(size)
+    ) + "\n"
+
+
+def roll_grid(size: int, rng: random.Random) -> str:
+    """Day 4: a square grid of about size tiles, roughly 60 % of them rolls."""
+    side = max(1, isqrt(size))
+    return "\n".join(
+        "".join("@" if rng.random() < 0.6 else "." for _ in range(side)) for _ in range(side)
+    ) + "\n"
+
+
+def ingredient_database(size: int, rng: random.Random) -> str:
+    """Day 5: size fresh ingredient ranges, followed by size ingredient IDs."""
+    top = 10 ** 15
+    ranges = []
+    for _ in range(size):
+        low = rng.randint(1, top)
+        ranges.append(f"{low}-{low + rng.randint(0, top // max(1, size))}")
+    ingredients = [str(rng.randint(1, top)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients) + "\n"
+
+
+def worksheet(size: int, rng: random.Random) -> str:
+    """
+    Day 6: size problems of four numbers each. Numbers in a problem are
+    all left or all right aligned and get shorter from top to bottom, so
+    every digit column of a problem reads as a number as well.
+    """
+    rows = [[], [], [], []]
+    operators = []
+    for _ in range(size):
+        width = rng.randint(1, 4)
+        lengths = sorted((rng.randint(1, width) for _ in range(len(rows) - 1)), reverse=True)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, length in zip(rows, [width, *lengths]):
+            number = "".join(rng.choice("123456789") for _ in range(length))
+            row.append(align(number, width))
+        operators.append(rng.choice("+*").ljust(width))
+    return "\n".join(" ".join(row) for row in [*rows, operators]) + "\n"
+
+
+def manifold(size: int, rng: random.Random) -> str:
+    """
+    Day 7: a manifold of size rows. The source beam enters in the middle
+    of the top row. Every other row holds splitters inside the light cone.
+    """
+    depth = max(2, size)
+    width = depth | 1  # odd, to have a middle column
+    middle = width // 2
+    lines = []
+    for y in range(depth):
+        row = ["."] * width
+        if y == 0:
+            row[middle] = "S"
+        elif y % 2 == 0:
+            spread = y // 2 - 1
+            for x in range(middle - spread, middle + spread + 1, 2):
+                if 0 < x < width - 1 and rng.random() < 0.7:
+                    row[x] = "^"
+        lines.append("".join(row))
+    return "\n".join(lines) + "\n"
+
+
+def junction_boxes(size: int, rng: random.Random) -> str:
+    """Day 8: size distinct points in 3D space."""
+    points = set()
+    while len(points) < size:
+        points.add((rng.randint(0, 99_999), rng.randint(0, 99_999), rng.randint(0, 99_999)))
+    return "\n".join(",".join(map(str, point)) for point in points) + "\n"
+
+
+def red_tiles(size: int, rng: random.Random) -> str:
+    """
+    Day 9: an x-monotone rectilinear polygon with about size corners.
+    It is built from size // 4 adjacent columns, each a vertical interval
+    that overlaps its neighbours. Corners are listed in boundary order.
+    """
+    columns = max(1, size // 4)
+    xs = sorted(rng.sample(range(1, 100_000), columns + 1))
+    bottoms, tops = [], []
+    for _ in range(columns):
+        while True:
+            bottom = rng.randint(1, 49_999)
+            top = rng.randint(50_001, 99_999)
+            if not bottoms or (bottom != bottoms[-1] and top != tops[-1]):
+                break
+        bottoms.append(bottom)
+        tops.append(top)
+    corners = []
+    for i in range(columns):
+        corners += [(xs[i], tops[i]), (xs[i + 1], tops[i])]
+    for i in reversed(range(columns)):
+        corners += [(xs[i + 1], bottoms[i]), (xs[i], bottoms[i])]
+    return "\n".join(f"{x},{y}" for x, y in corners) + "\n"
+
+
+def machines(size: int, rng: random.Random) -> str:
+    """
+    Day 10: size machines. The light pattern is the effect of pressing a proper,
+    nonempty subset of the buttons once, and the joltages are the effect of
+    pressing each button a random number of times, so both parts are solvable.
+    """
+    lines = []
+    for _ in range(size):
+        lights = rng.randint(3, 8)
+        buttons = [
+            sorted(rng.sample(range(lights), rng.randint(1, lights)))
+            for _ in range(rng.randint(3, 7))
+        ]
+        while True:
+            pressed = rng.sample(buttons, rng.randint(1, len(buttons) - 1))
+            state = [sum(i in button for button in pressed) % 2 for i in range(lights)]
+            if any(state):
+                break
+        joltages = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for i in button:
+                joltages[i] += presses
+        lines.append(" ".join([
+            "[" + "".join(".#"[on] for on in state) + "]",
+            *("(" + ",".join(map(str, button)) + ")" for button in buttons),
+            "{" + ",".join(map(str, joltages)) + "}",
+        ]))
+    return "\n".join(lines) + "\n"
+
+
+def device_graph(size: int, rng: random.Random) -> str:
+    """
+    Day 11: a DAG of size devices. "svr" comes first, "you", "fft" and "dac"
+    follow in that order, and every device feeds into its successor, so "out"
+    can be reached from everywhere.
+    """
+    fixed = {"svr", "you", "fft", "dac", "out"}
+    count = max(size, len(fixed))
+    names = set()
+    while len(names) < count - len(fixed):
+        name = "".join(rng.choices(string.ascii_lowercase, k=3))
+        if name not in fixed:
+            names.add(name)
+    order = sorted(names)
+    rng.shuffle(order)
+    for name, position in (("fft", 1 / 3), ("dac", 2 / 3), ("you", 1 / 6)):
+        order.insert(int(position * len(order)), name)
+    order = ["svr", *order, "out"]
+
+    lines = []
+    for i, name in enumerate(order[:-1]):
+        fanout = {order[i + 1]}
+        for _ in range(rng.randint(0, 2)):
+            fanout.add(order[rng.randint(i + 1, min(i + 20, len(order) - 1))])
+        lines.append(f"{name}: " + " ".join(sorted(fanout)))
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def regions(size: int, rng: random.Random) -> str:
+    """Day 12: six random 3x3 shapes, then size regions with their shape quantities."""
+    blocks = []
+    for shape_id in range(6):
+        while True:
+            cells = [rng.choice("#.") for _ in range(9)]
+            if "#" in cells:
+                break
+        rows = ["".join(cells[i: i + 3]) for i in range(0, 9, 3)]
+        blocks.append(f"{shape_id}:\n" + "\n".join(rows))
+    lines = []
+    for _ in range(size):
+        width, length = rng.randint(10, 50), rng.randint(10, 50)
+        quantities = [rng.randint(0, width * length // 15) for _ in range(6)]
+        lines.append(f"{width}x{length}: " + " ".join(map(str, quantities)))
+    blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+@dataclass(frozen=True)
+class Scaling:
+    generate: Generator
+    base: int  # the smallest size of a default size sweep
+
+
+GENERATORS: dict[int, Scaling] = {
+    1: Scaling(rotations, 10_000),
+    2: Scaling(id_ranges, 10_000),
+    3: Scaling(banks, 200),
+    4: Scaling(roll_grid, 2_500),
+    5: Scaling(ingredient_database, 250),
+    6: Scaling(worksheet, 500),
+    7: Scaling(manifold, 50),
+    8: Scaling(junction_boxes, 50),
+    9: Scaling(red_tiles, 12),
+    10: Scaling(machines, 5),
+    11: Scaling(device_graph, 200),
+    12: Scaling(regions, 100),
+}
+
+
+def seeded(day: int, size: int, seed: int = 0) -> random.Random:
+    return random.Random(f"{day}:{size}:{seed}")
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    return GENERATORS[day].generate(size, seeded(day, size, seed))
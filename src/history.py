@@ -0,0 +1,159 @@
+"""
+Benchmark history with regression gating.
+bench.py appends every run to a JSON Lines file, one run per line.
+Run this module to list the stored runs, or to compare the latest run
+against the baseline: the latest earlier run of the same kind (puzzle input,
+sweep with the same seed, startup, or strategies) marked with bench.py --baseline, or else the
+first run of that kind. The comparison exits with status 1 if any stage
+got slower by more than the threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+
+HISTORY_FILE = Path(__file__).parent / ".cache" / "bench_history.jsonl"
+THRESHOLD = 10.0  # percent
+
+type Key = tuple[int, str, int | None, str | None]  # (day, stage, size of generated input, strategy)
+
+
+def append(records: list[dict], settings: dict, baseline: bool = False, file: Path = HISTORY_FILE) -> None:
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "baseline": baseline,
+        "settings": settings,
+        "results": records,
+    }
+    file.parent.mkdir(parents=True, exist_ok=True)
+    with file.open("a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load(file: Path = HISTORY_FILE) -> list[dict]:
+    if not file.exists():
+        return []
+    with file.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def kind(run: dict) -> tuple:
+    settings = run["settings"]
+    if settings.get("startup"):
+        return ("startup",)
+    if settings.get("strategies"):
+        return ("strategies",)
+    if settings.get("sweep"):
+        return "sweep", settings.get("seed")
+    return ("puzzle input",)
+
+
+def same_kind(a: dict, b: dict) -> bool:
+    return kind(a) == kind(b)
+
+
+def find_baseline(runs: list[dict], current: dict) -> dict | None:
+    """
+    Among the runs of the same kind as the current one, return
+    the latest one marked as baseline, or else the first one.
+    """
+    candidates = [run for run in runs if same_kind(run, current)]
+    for run in reversed(candidates):
+        if run["baseline"]:
+            return run
+    return candidates[0] if candidates else None
+
+
+def by_key(run: dict) -> dict[Key, dict]:
+    return {
+        (record["day"], record["stage"], record.get("size"), record.get("strategy")): record
+        for record in run["results"]
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = THRESHOLD, metric: str = "median") -> list[dict]:
+    """
+    Compare every stage that both runs have measured.
+    Return one row per stage, with the relative change of the metric
+    in percent, and whether this is a regression beyond the threshold.
+    """
+    old, new = by_key(baseline), by_key(current)
+    rows = []
+    for key in sorted(old.keys() & new.keys(), key=lambda k: (k[0], k[1], k[2] or 0, k[3] or "")):
+        before, after = old[key][metric], new[key][metric]
+        change = (after - before) / before * 100 if before > 0 else 0.0
+        rows.append({
+            "day": key[0], "stage": key[1], "size": key[2], "strategy": key[3],
+            "before": before, "after": after, "change": change,
+            "peak_before": old[key].get("peak_bytes"), "peak_after": new[key].get("peak_bytes"),
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def format_row(row: dict) -> str:
+    size = f" n = {row['size']:<8}" if row["size"] is not None else ""
+    strategy = f" {row['strategy']:<16}" if row.get("strategy") is not None else ""
+    flag = "  <-- REGRESSION" if row["regression"] else ""
+    peak = ""
+    if row["peak_before"] is not None and row["peak_after"] is not None:
+        peak = f"  peak {row['peak_before'] / 2 ** 20:8.3f} MiB -> {row['peak_after'] / 2 ** 20:8.3f} MiB"
+    return (
+        f"day {row['day']:02d} {row['stage']:<6}{strategy}{size}"
+        f"  {row['before'] * 1000:10.3f} ms -> {row['after'] * 1000:10.3f} ms"
+        f"  {row['change']:+7.1f} %{peak}{flag}"
+    )
+
+
+def format_run(index: int, run: dict) -> str:
+    mark = " (baseline)" if run["baseline"] else ""
+    mode = kind(run)[0]
+    days = sorted({record["day"] for record in run["results"]})
+    return (
+        f"#{index} {run['timestamp']} python {run['python']}, {mode}"
+        f", days {', '.join(f'{day:02d}' for day in days)}{mark}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect the benchmark history of bench.py.")
+    parser.add_argument("command", choices=("list", "compare"), help="list the runs, or compare the latest run")
+    parser.add_argument(
+        "-t", "--threshold", type=float, default=THRESHOLD,
+        help=f"percent a stage may get slower before it counts as a regression (default={THRESHOLD})")
+    parser.add_argument(
+        "-m", "--metric", choices=("min", "median", "p95"), default="median",
+        help="runtime statistic to compare (default=median)")
+    parser.add_argument(
+        "--history", type=Path, default=HISTORY_FILE,
+        help="benchmark history file (default=.cache/bench_history.jsonl)")
+    args = parser.parse_args()
+
+    runs = load(args.history)
+
+    if args.command == "list":
+        for index, run in enumerate(runs):
+            print(format_run(index, run))
+        return
+
+    current = runs[-1] if runs else None
+    baseline = find_baseline(runs[:-1], current) if current is not None else None
+    if baseline is None:
+        print("Nothing to compare: need a baseline and a later run of the same kind.")
+        sys.exit(2)
+
+    rows = compare(baseline, current, args.threshold, args.metric)
+    for row in rows:
+        print(format_row(row))
+
+    regressions = [row for row in rows if row["regression"]]
+    print(f"{len(regressions)} of {len(rows)} stages got more than {args.threshold} % slower ({args.metric}).")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
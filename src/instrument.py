@@ -0,0 +1,93 @@
+"""
+Profile a single solver call with cProfile and tracemalloc.
+Both tools run at the same time, so the reported times are inflated by
+the tracing overhead. They are good to rank hot spots, not to benchmark.
+"""
+import cProfile
+import pstats
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+TOP = 10  # default number of hot functions and allocation sites to report
+
+
+def function_name(location: tuple[str, int, str]) -> str:
+    file, line, name = location
+    if file == "~":  # built-in function
+        return name
+    return f"{Path(file).name}:{line}({name})"
+
+
+def hot_functions(profiler: cProfile.Profile, top: int) -> list[dict]:
+    stats = pstats.Stats(profiler).stats
+    stats = {location: stat for location, stat in stats.items() if "_lsprof.Profiler" not in location[2]}
+    ranking = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)  # by own time
+    return [
+        {
+            "function": function_name(location),
+            "calls": calls,
+            "primitive_calls": primitive_calls,
+            "tottime": tottime,
+            "cumtime": cumtime,
+        }
+        for location, (primitive_calls, calls, tottime, cumtime, _) in ranking[:top]
+    ]
+
+
+def allocation_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[dict]:
+    statistics = snapshot.statistics("lineno")
+    return [
+        {
+            "location": f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            "bytes": stat.size,
+            "blocks": stat.count,
+        }
+        for stat in statistics[:top]
+    ]
+
+
+def profile(func: Callable[[Any], Any], arg: Any, top: int = TOP) -> tuple[Any, dict]:
+    """
+    Call func(arg) under cProfile and tracemalloc. Return the result and a report:
+    the top functions by own time, the peak of traced memory, and the memory
+    blocks (count, bytes, top sites) that are still allocated when func returns.
+    """
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+        try:
+            result = func(arg)
+        finally:
+            profiler.disable()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+    finally:
+        tracemalloc.stop()
+
+    traces = snapshot.statistics("filename")
+    report = {
+        "hot_functions": hot_functions(profiler, top),
+        "peak_bytes": peak,
+        "live_blocks": sum(stat.count for stat in traces),
+        "live_bytes": sum(stat.size for stat in traces),
+        "allocation_sites": allocation_sites(snapshot, top),
+    }
+    return result, report
+
+
+def peak_memory(func: Callable[[Any], Any], arg: Any) -> int:
+    """Call func(arg) under tracemalloc and return the peak of traced memory in bytes."""
+    tracemalloc.start()
+    try:
+        func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
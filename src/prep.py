@@ -1,27 +1,44 @@
 """
 Prepare for a new day of AoC 2025.
-(1) Create a dayNN.py file for the code.
+(1) Create a dayNN.py file for the code. It registers with the runner,
+    so bench.py can time it and, once its generator is written, sweep it.
 (2) Download puzzle input and create a dayNN.txt file.
+Several days can be prepared at once. Their inputs are then fetched
+concurrently over one pooled session, with retries and backoff.
+Downloaded inputs are kept in a local cache, together with their ETag and
+Last-Modified headers. A cached input is not requested again, unless
+--refresh asks to revalidate it with a conditional request.
 """
 import argparse
 import configparser
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from string import Template
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 YEAR = 2025
+BASE_URL = "https://adventofcode.com"
+CACHE_DIR = Path(".cache") / "inputs"
+WORKERS = 4  # concurrent downloads, please be nice to the AoC servers
+RETRIES = 3
+BACKOFF = 1.0  # seconds, doubled with every retry
+TIMEOUT = 30.0  # seconds
 
 prog_template = Template('''"""
 AdventOfCode $year Day $day
 https://adventofcode.com/$year/day/$day
 """
 import configparser
-import time
 from pathlib import Path
 
+import runner
+
 
 def parse(text: str):
     ...
@@ -35,6 +52,13 @@ def solve_part2(puzzle_input) -> int:
     ...
 
 
+runner.register(
+    $day, parse=parse, part1=solve_part1, part2=solve_part2,
+    generate=None,  # for bench.py --sweep: def generate(size: int, rng: random.Random) -> str
+    complexity={"parse": 1.0, "part1": 1.0, "part2": 1.0},
+)
+
+
 def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
     example = configparser.ConfigParser(delimiters=('=',), comment_prefixes=(';',))
     with open(file) as f:
@@ -46,65 +70,115 @@ def load_example(file: Path) -> tuple[str | None, int | None, int | None]:
 
 
 def main() -> None:
+    """Check the example, then solve the parts that pass. See bench.py for timing statistics."""
+    puzzle = runner.registry[$day]
+    text, part1_ex, part2_ex = load_example(Path(__file__).with_suffix(".ini"))
 
-    example = load_example(Path(__file__).with_suffix(".ini"))
-
-    if solve_part1(example[0]) != example[1]:
-        print("Part 1 not done")
-        exit()
-
-    puzzle_input = Path(__file__).with_suffix(".txt").read_text()
-
-    start = time.perf_counter()
-    answer = solve_part1(puzzle_input)
-    end = time.perf_counter()
-    print(f"Part 1 solution: {answer}, runtime = {end - start:.3f} s")
+    passed = runner.check_example(puzzle, text, {1: part1_ex, 2: part2_ex})
+    for part, ok in passed.items():
+        if not ok:
+            print(f"Part {part} not done")
 
-    if solve_part2(example[0]) != example[2]:
-        print("Part 2 not done")
-        exit()
-
-    start = time.perf_counter()
-    answer = solve_part2(puzzle_input)
-    end = time.perf_counter()
-    print(f"Part 2 solution: {answer}, runtime = {end - start:.3f} s")
+    tasks = [($day, part) for part, ok in passed.items() if ok]
+    if tasks and puzzle.input_file.exists():
+        for result in runner.run_sequential(tasks):
+            print(runner.format_result(result))
 
 
 if __name__ == "__main__":
     main()
 ''')
 
-url_template = Template('https://adventofcode.com/$year/day/$day/input')
+url_template = Template('$base/$year/day/$day/input')
 
 load_dotenv()
 
 
-def download(url: str) -> str | None:
-    headers = {"Cookie": os.environ.get("ADVENT_OF_CODE")}
-    response = requests.get(url, headers=headers)
-    if not response.ok:
-        print(response.status_code, response.reason)
+def new_session(workers: int = WORKERS) -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = "github.com/techrabbit58/AdventOfCode2025 prep.py"
+    if cookie := os.environ.get("ADVENT_OF_CODE"):
+        session.headers["Cookie"] = cookie
+    retry = Retry(
+        total=RETRIES,
+        backoff_factor=BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=workers, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download(url: str, session: requests.Session, cache_file: Path, refresh: bool = False) -> str | None:
+    """
+    Get the text at url, or None if it is not available.
+    The text is cached in cache_file, and its url and headers in a .json file next to it.
+    A cached text from another url, like a local test server, does not count.
+    """
+    meta_file = cache_file.with_suffix(".json")
+    meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
+    cached = cache_file.exists() and meta.get("url") == url
+
+    if cached and not refresh:
+        return cache_file.read_text()
+
+    headers = {}
+    if cached:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = session.get(url, headers=headers, timeout=TIMEOUT)
+    except requests.RequestException as e:
+        print(url, e)
         return None
-    else:
-        return response.text
 
+    if response.status_code == 304:  # not modified
+        return cache_file.read_text()
+    if not response.ok:
+        print(url, response.status_code, response.reason)
+        return None
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Prepare for a new day of AoC (1...12).")
-    parser.add_argument("day", metavar="DAY", type=int, choices=range(1, 13))
-    parser.add_argument(
-        "-d", "--download",
-        action="store_true",
-        default=False,
-        help="option flag: if set, get your puzzle input (default=not set)")
-    args = parser.parse_args()
-
-    prog = Path(f"day{args.day:02d}.py")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(response.text)
+    meta_file.write_text(json.dumps({
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }))
+    return response.text
+
+
+def download_all(
+        days: list[int], base_url: str = BASE_URL, cache_dir: Path = CACHE_DIR,
+        workers: int = WORKERS, refresh: bool = False,
+) -> dict[int, str | None]:
+    """Get the puzzle inputs of the given days, at most workers at a time."""
+    with new_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as executor:
+        texts = executor.map(
+            lambda day: download(
+                url_template.substitute(base=base_url, day=day, year=YEAR),
+                session,
+                cache_dir / f"day{day:02d}.txt",
+                refresh,
+            ),
+            days,
+        )
+        return dict(zip(days, texts))
+
+
+def prepare_files(day: int) -> None:
+    prog = Path(f"day{day:02d}.py")
 
     if prog.exists():
         print(f"File exists: {prog.as_posix()}, did not overwrite")
     else:
-        prog.write_text(prog_template.substitute(day=args.day, year=YEAR))
+        prog.write_text(prog_template.substitute(day=day, year=YEAR))
         print(f"New file: {prog.as_posix()}")
 
     ini = prog.with_suffix(".ini")
@@ -118,23 +192,63 @@ def main() -> None:
             example.write(f)
         print(f"New file: {ini.as_posix()}")
 
-    data = prog.with_suffix(".txt")
 
-    if data.exists():
-        print(f"File exists: {data.as_posix()}, did not overwrite")
+def write_input(day: int, text: str | None) -> None:
+    data = Path(f"day{day:02d}.txt")
+    if text and text != "":
+        data.write_text(text)
+        print(f"New file: {data.as_posix()}")
+    elif text is None:
+        print(f"No new file: {data.as_posix()}, input is not yet available.")
+        print(f"Do not try again before day {day}. This is pointless.")
     else:
-        if args.download:
-            text = download(url_template.substitute(day=args.day, year=YEAR))
-        else:
-            text = ""
-        if text and text != "":
-            data.write_text(text)
-            print(f"New file: {data.as_posix()}")
-        elif text is None:
-            print(f"No new file: {data.as_posix()}, input is not yet available.")
-            print(f"Do not try again before day {args.day}. This is pointless.")
+        print(f"No new file: {data.as_posix()}, use --download to get it.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Prepare for one or more new days of AoC (1...12).")
+    parser.add_argument("days", metavar="DAY", type=int, nargs="+", choices=range(1, 13))
+    parser.add_argument(
+        "-d", "--download",
+        action="store_true",
+        default=False,
+        help="option flag: if set, get your puzzle input (default=not set)")
+    parser.add_argument(
+        "-r", "--refresh",
+        action="store_true",
+        default=False,
+        help="option flag: if set, revalidate cached puzzle input with the server (default=not set)")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=WORKERS,
+        help=f"number of concurrent downloads (default={WORKERS})")
+    parser.add_argument(
+        "--base-url", default=os.environ.get("AOC_BASE_URL", BASE_URL),
+        help=f"server to download from (default=$AOC_BASE_URL or {BASE_URL})")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("need at least one worker")
+
+    days = sorted(set(args.days))
+
+    for day in days:
+        prepare_files(day)
+
+    missing = []
+    for day in days:
+        data = Path(f"day{day:02d}.txt")
+        if data.exists():
+            print(f"File exists: {data.as_posix()}, did not overwrite")
         else:
-            print(f"No new file: {data.as_posix()}, use --download to get it.")
+            missing.append(day)
+
+    if args.download and missing:
+        texts = download_all(missing, args.base_url, CACHE_DIR, args.workers, args.refresh)
+    else:
+        texts = {day: "" for day in missing}
+
+    for day in missing:
+        write_input(day, texts[day])
 
 
 if __name__ == "__main__":
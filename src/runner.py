@@ -0,0 +1,388 @@
+"""
+Shared runner for the AoC 2025 solutions.
+Every dayNN.py module registers its parser and its part solvers here,
+so that tools like bench.py can find and run any day the same way.
+A module may register alternative solvers for a part as named strategies,
+for bench.py --strategies to check and compare with the default solver.
+Inputs that are known to trip up a strategy can be registered as edge cases,
+to be checked along with the example.
+
+Run this module to solve many days at once, either one after another,
+or with --parallel, each day/part as a task in a process pool.
+With --profile, each part is solved under cProfile and tracemalloc.
+
+Every day module imports this one, so it must stay cheap to import.
+Process pools, the parse cache and the profiler are imported where used.
+"""
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import re
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from random import Random
+
+    from cache import ParseCache
+
+SRC = Path(__file__).parent
+MODULE_PATTERN = re.compile(r"day(\d\d)\.py")
+POLL_INTERVAL = 0.05  # seconds between timeout checks in parallel mode
+
+type Parser = Callable[[str], Any]
+type Solver = Callable[[Any], int]
+type Generator = Callable[[int, Random], str]  # (size, rng) -> puzzle text
+type Task = tuple[int, int]  # (day, part)
+
+DEFAULT = "default"  # strategy name of the solver passed to register()
+
+
+@dataclass(frozen=True, kw_only=True)
+class Puzzle:
+    day: int
+    parse: Parser | None  # None: the solvers take the raw puzzle text
+    part1: Solver
+    part2: Solver | None  # None: there is no part 2 (day 12)
+    generate: Generator | None = None  # None: use the one in generators.py, if any
+    base_size: int = 100  # smallest size of a bench.py --sweep
+    complexity: dict[str, float] = field(default_factory=dict)  # stage: expected exponent k in O(n^k)
+    edge_cases: dict[str, str] = field(default_factory=dict)  # name: puzzle text, for bench.py --strategies
+
+    @property
+    def input_file(self) -> Path:
+        return SRC / f"day{self.day:02d}.txt"
+
+    @property
+    def parts(self) -> dict[int, Solver]:
+        solvers = {1: self.part1, 2: self.part2}
+        return {part: solver for part, solver in solvers.items() if solver is not None}
+
+    def strategies(self, part: int) -> dict[str, Solver]:
+        """The registered solver of the part first, then its alternatives."""
+        return {DEFAULT: self.parts[part]} | alternatives.get((self.day, part), {})
+
+    def strategy_parser(self, part: int, name: str) -> Parser | None:
+        """The parser a strategy registered for itself, or None if it takes the input of the default solver."""
+        return strategy_parsers.get((self.day, part, name))
+
+    def read_input(self) -> str:
+        return self.input_file.read_text()
+
+    def prepare(self, text: str, cache: "ParseCache | None" = None) -> tuple[Any, bool]:
+        """Return (parsed input, cache hit). Without a cache, always parse."""
+        if self.parse is None:
+            return text, False
+        if cache is None:
+            return self.parse(text), False
+        return cache.parse(self.parse, text)
+
+
+registry: dict[int, Puzzle] = {}
+alternatives: dict[Task, dict[str, Solver]] = {}
+strategy_parsers: dict[tuple[int, int, str], Parser] = {}  # (day, part, strategy name): its own parser
+
+
+def register(
+        day: int, *,
+        parse: Parser | None = None,
+        part1: Solver,
+        part2: Solver | None = None,
+        generate: Generator | None = None,
+        base_size: int = 100,
+        complexity: dict[str, float] | None = None,
+        edge_cases: dict[str, str] | None = None,
+) -> Puzzle:
+    puzzle = Puzzle(
+        day=day, parse=parse, part1=part1, part2=part2,
+        generate=generate, base_size=base_size, complexity=complexity or {},
+        edge_cases=edge_cases or {},
+    )
+    registry[day] = puzzle
+    return puzzle
+
+
+def register_strategy(day: int, part: int, name: str, solver: Solver, parse: Parser | None = None) -> None:
+    """
+    Register an alternative solver for a part. It must give the same answers as the default.
+    If parse is set, the solver takes the puzzle text parsed by it, instead of by the puzzle's parser.
+    """
+    if name == DEFAULT:
+        raise ValueError(f"strategy name {DEFAULT!r} is reserved")
+    alternatives.setdefault((day, part), {})[name] = solver
+    if parse is not None:
+        strategy_parsers[(day, part, name)] = parse
+
+
+def available(module: str) -> bool:
+    """Tell whether an optional dependency like numpy is installed, without importing it."""
+    return importlib.util.find_spec(module) is not None
+
+
+def discover() -> list[int]:
+    """Find the numbers of all dayNN.py modules next to this file."""
+    return sorted(
+        int(m[1]) for file in SRC.glob("day*.py")
+        if (m := MODULE_PATTERN.fullmatch(file.name))
+    )
+
+
+def load(day: int) -> Puzzle:
+    """Import the module of the given day, so that it registers its puzzle."""
+    if day not in registry:
+        importlib.import_module(f"day{day:02d}")
+    if day not in registry:
+        raise LookupError(f"day{day:02d}.py does not register a puzzle")
+    return registry[day]
+
+
+def check_example(puzzle: Puzzle, text: str | None, answers: dict[int, int | None]) -> dict[int, bool]:
+    """
+    Solve the example for every part and tell which parts give the expected answer.
+    A part without example text or expected answer does not pass.
+    """
+    if not text:
+        return {part: False for part in puzzle.parts}
+    puzzle_input, _ = puzzle.prepare(text)
+    return {
+        part: answers.get(part) is not None and solver(puzzle_input) == answers[part]
+        for part, solver in puzzle.parts.items()
+    }
+
+
+def run_task(day: int, part: int, cached: bool = True, profile_top: int | None = None) -> dict:
+    """
+    Parse the puzzle input of a day and solve one part of it.
+    If cached is set, take the parsed input from the parse cache if possible.
+    If profile_top is set, profile the solver and report that many hot spots.
+    """
+    from cache import ParseCache
+
+    puzzle = load(day)
+    text = puzzle.read_input()
+    start = time.perf_counter()
+    puzzle_input, hit = puzzle.prepare(text, ParseCache() if cached else None)
+    parsed = time.perf_counter()
+    if profile_top is None:
+        answer = puzzle.parts[part](puzzle_input)
+        report = None
+    else:
+        import instrument
+        answer, report = instrument.profile(puzzle.parts[part], puzzle_input, profile_top)
+    end = time.perf_counter()
+    result = {
+        "day": day, "part": part, "status": "ok", "answer": answer,
+        "parse": parsed - start, "solve": end - parsed, "cache_hit": hit,
+    }
+    if report is not None:
+        result["profile"] = report
+    return result
+
+
+def failed_task(task: Task, status: str, reason: str) -> dict:
+    day, part = task
+    return {
+        "day": day, "part": part, "status": status, "answer": None,
+        "parse": None, "solve": None, "cache_hit": False, "reason": reason,
+    }
+
+
+def run_sequential(tasks: Iterable[Task], **options) -> list[dict]:
+    """Solve each task in this process. The options are passed on to run_task."""
+    results = []
+    for task in tasks:
+        try:
+            results.append(run_task(*task, **options))
+        except Exception as e:
+            results.append(failed_task(task, "error", repr(e)))
+    return results
+
+
+started_tasks: "Queue | None" = None  # set in each pool worker
+
+
+def init_worker(started: "Queue") -> None:
+    global started_tasks
+    started_tasks = started
+
+
+def run_pooled_task(day: int, part: int, **options) -> dict:
+    """Tell the parent process that the task starts now, then run it."""
+    started_tasks.put((day, part))
+    return run_task(day, part, **options)
+
+
+def run_round(
+        tasks: list[Task], workers: int, timeout: float | None, options: dict, results: dict[Task, dict],
+) -> list[Task]:
+    """
+    Run the tasks in a fresh process pool, until all of them are done or
+    every worker is stuck with a task that has exceeded its timeout.
+    The timeout clock of a task starts when a worker picks it up.
+    Stuck workers are terminated. Return the tasks that did not finish.
+    """
+    import multiprocessing
+    import queue
+    from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+    started = multiprocessing.Queue()
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(started,))
+    futures: dict[Future, Task] = {executor.submit(run_pooled_task, *task, **options): task for task in tasks}
+    pending = set(futures)
+    start_times: dict[Task, float] = {}
+    expired = 0
+
+    while pending and expired < workers:
+        done, pending = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = failed_task(futures[future], "error", repr(e))
+
+        if timeout is None:
+            continue
+
+        now = time.perf_counter()
+        try:
+            while True:
+                start_times[tuple(started.get_nowait())] = now
+        except queue.Empty:
+            pass
+
+        for future in list(pending):
+            task = futures[future]
+            if task in start_times and now - start_times[task] > timeout:
+                results[task] = failed_task(task, "timeout", f"exceeded {timeout} s")
+                pending.remove(future)
+                expired += 1
+
+    if expired:
+        executor.terminate_workers()
+    else:
+        executor.shutdown()
+
+    return [task for task in tasks if task not in results]
+
+
+def run_parallel(tasks: Iterable[Task], workers: int, timeout: float | None = None, **options) -> list[dict]:
+    """
+    Solve each task in a process pool with the given number of workers.
+    Tasks that exceed the timeout (in seconds) are reported with status "timeout".
+    The options are passed on to run_task.
+    """
+    tasks = list(tasks)
+    results: dict[Task, dict] = {}
+    remaining = tasks
+    while remaining:
+        remaining = run_round(remaining, workers, timeout, options, results)
+    return [results[task] for task in tasks]
+
+
+def format_result(result: dict) -> str:
+    head = f"day {result['day']:02d} part {result['part']}"
+    if result["status"] != "ok":
+        return f"{head}: {result['status']} ({result['reason']})"
+    source = "cached" if result["cache_hit"] else "parse"
+    line = (
+        f"{head}: answer = {result['answer']}"
+        f", {source} = {result['parse']:.3f} s, solve = {result['solve']:.3f} s"
+    )
+    if "profile" not in result:
+        return line
+    report = result["profile"]
+    lines = [
+        line,
+        f"    peak memory = {report['peak_bytes'] / 2 ** 20:.3f} MiB"
+        f", still allocated = {report['live_blocks']} blocks ({report['live_bytes']} bytes)",
+    ]
+    for hot in report["hot_functions"]:
+        lines.append(
+            f"    {hot['tottime']:8.3f} s own {hot['cumtime']:8.3f} s cum"
+            f" {hot['calls']:>10} calls  {hot['function']}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    import instrument
+
+    parser = argparse.ArgumentParser(description="Solve the AoC puzzles of many days at once.")
+    parser.add_argument("days", metavar="DAY", type=int, nargs="*", help="days to run (default: all)")
+    parser.add_argument(
+        "-p", "--parallel",
+        action="store_true",
+        default=False,
+        help="option flag: if set, solve each day/part in a process pool (default=not set)")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.process_cpu_count(),
+        help="number of worker processes in parallel mode (default=number of CPUs)")
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None,
+        help="seconds a task may run in parallel mode (default=no limit)")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="option flag: if set, profile time and memory of each part (default=not set)")
+    parser.add_argument(
+        "--top", type=int, default=instrument.TOP,
+        help=f"number of hot functions and allocation sites per part in profile mode (default={instrument.TOP})")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="option flag: if set, always parse, do not use the parse cache (default=not set)")
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        default=False,
+        help="option flag: if set, print a JSON report instead of a table (default=not set)")
+    args = parser.parse_args()
+
+    if not args.parallel and args.timeout is not None:
+        parser.error("--timeout needs --parallel")
+    if args.workers < 1:
+        parser.error("need at least one worker")
+
+    tasks = []
+    skipped = []
+    for day in args.days or discover():
+        puzzle = load(day)
+        if puzzle.input_file.exists():
+            tasks.extend((day, part) for part in puzzle.parts)
+        else:
+            skipped.append(day)
+
+    options = {"cached": not args.no_cache, "profile_top": args.top if args.profile else None}
+
+    start = time.perf_counter()
+    if args.parallel:
+        results = run_parallel(tasks, args.workers, args.timeout, **options)
+    else:
+        results = run_sequential(tasks, **options)
+    end = time.perf_counter()
+
+    if args.json:
+        report = {"wall": end - start, "results": results, "skipped": skipped}
+        print(json.dumps(report, indent=2))
+        return
+
+    for result in results:
+        print(format_result(result))
+    if skipped:
+        print("No puzzle input for day(s):", ", ".join(f"{day:02d}" for day in skipped))
+    print(f"total wall time = {end - start:.3f} s")
+
+
+if __name__ == "__main__":
+    # the day modules register with "runner", not with "__main__"
+    import runner
+    runner.main()